@@ -0,0 +1,64 @@
+"""
+Per-document cost of rendering coordinate reads, before and after the fast path.
+
+Run from the backend directory:
+    python -m benchmarks.serializationBenchmark
+"""
+import timeit
+from datetime import datetime
+from bson import ObjectId
+from models.coordinates import MinecraftCoordinate
+from services.serialization import dumps_documents
+
+
+def make_documents(count: int) -> list[dict]:
+    """Documents shaped like what Mongo returns for the coordinates collection"""
+    return [
+        {
+            "_id": ObjectId(),
+            "guild_id": "123456789012345678",
+            "guild_name": "Kami Test Server",
+            "channel_id": "223456789012345678",
+            "user_id": "323456789012345678",
+            "username": f"player{i % 50}",
+            "avatar_url": "https://cdn.discordapp.com/avatars/323456789012345678/abcdef.png",
+            "coordinateName": f"Iron Farm {i}",
+            "coordinates": {"x": i * 16, "y": 64, "z": -i * 8},
+            "dimension": ("overworld", "nether", "end")[i % 3],
+            "created_at": datetime(2025, 1, 1, 12, 0, i % 60, 123000),
+        }
+        for i in range(count)
+    ]
+
+
+def before(documents: list[dict]) -> bytes:
+    """Old path: mongo_to_pydantic, response_model re-validation, then JSON encoding"""
+    models = []
+    for document in documents:
+        coord = dict(document)
+        coord["_id"] = str(coord["_id"])
+        models.append(MinecraftCoordinate(**coord))
+    # FastAPI dumps the returned models and validates them again against response_model
+    revalidated = [MinecraftCoordinate.model_validate(m.model_dump(mode="json", by_alias=True)) for m in models]
+    return b"[" + b",".join(m.model_dump_json(by_alias=True).encode() for m in revalidated) + b"]"
+
+
+def after(documents: list[dict]) -> bytes:
+    """Fast path: trusted documents go straight to JSON bytes"""
+    return dumps_documents(documents)
+
+
+def main():
+    for count in (1_000, 10_000):
+        documents = make_documents(count)
+        repeat = 5 if count == 1_000 else 2
+        results = {}
+        for label, render in (("before", before), ("after", after)):
+            best = min(timeit.repeat(lambda: render(documents), number=1, repeat=repeat))
+            results[label] = best
+            print(f"{count:>6} docs  {label:<6}  {best * 1000:9.2f} ms total  {best / count * 1e6:7.2f} us/doc")
+        print(f"{count:>6} docs  speedup {results['before'] / results['after']:.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,67 @@
-from pydantic import BaseSettings # type: ignore
+from typing import Literal, Optional
+from dotenv import load_dotenv, find_dotenv
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# The .env is looked up from this module upwards (e.g. the repo root), whatever the working directory
+load_dotenv(find_dotenv())
 
 class Settings(BaseSettings):
     app_name: str = "Discord Bot API"
     version: str = "1.0.0"
 
+    # MongoDB
+    mongo_connection_string: str = Field(..., validation_alias="mongoConnectionString")
+    mongo_db_name: str = "test_db"
+    mongo_coordinates_collection: str = "test_coordinates"
+    mongo_sessions_collection: str = "chat_sessions"
+    mongo_max_pool_size: int = 50
+    mongo_min_pool_size: int = 0
+    mongo_max_idle_time_ms: Optional[int] = 60000
+    mongo_server_selection_timeout_ms: int = 5000
+    mongo_connect_timeout_ms: int = 5000
+    mongo_socket_timeout_ms: Optional[int] = 10000
+
+    # In-process cache of per-guild coordinate reads. Writes only invalidate the cache of
+    # the worker that handled them, so with several workers entries also expire by age
+    response_cache_max_bytes: int = 32 * 1024 * 1024
+    response_cache_max_entries: int = 10000
+    response_cache_ttl_seconds: float = 60.0
+    # In-memory spatial/name indexes (services/guildIndex.py): a loaded guild is rebuilt after this long
+    guild_index_max_age_seconds: float = 300.0
+
+    # Semantic cache of chatbot answers (services/answerCache.py)
+    answer_cache_enabled: bool = True
+    answer_cache_threshold: float = 0.92  # cosine similarity needed to reuse an answer
+    answer_cache_ttl_seconds: int = 24 * 60 * 60
+    answer_cache_max_entries: int = 5000
+    embedding_model: str = "nomic-embed-text"
+
+    # Cache of chatbot tool results (minecraft_assistant/bot_tools/toolCache.py)
+    tool_cache_max_entries: int = 2000
+    tool_cache_path: Optional[str] = None  # set to persist results across restarts (shelve file, used by one worker)
+    youtube_cache_ttl_seconds: int = 6 * 60 * 60
+    web_search_cache_ttl_seconds: int = 60 * 60
+
+    # YouTube tool (minecraft_assistant/bot_tools/youtubeTool.py)
+    youtube_search_timeout_seconds: float = 15.0  # hard deadline per search, queueing included
+    youtube_socket_timeout_seconds: float = 5.0
+    youtube_max_concurrency: int = 4  # extractions running at once (worker threads)
+
+    # Chatbot conversation memory (minecraft_assistant/MessageHistory.py)
+    chat_session_max_messages: int = 20
+    chat_session_max_tokens: int = 2000
+    chat_session_idle_ttl_seconds: int = 30 * 60
+    chat_history_max_total_tokens: int = 2_000_000  # all sessions together
+    chat_session_expiry_interval_seconds: int = 60
+    # Older turns are folded into a running summary once a session passes this many tokens
+    chat_history_summary_budget_tokens: int = 800
+    chat_history_keep_recent_messages: int = 4
+    # "memory" (per process) or "mongo" (survives restarts, shared by all workers)
+    chat_session_backend: Literal["memory", "mongo"] = "memory"
+    chat_session_cache_ttl_seconds: float = 10.0  # mongo: how long a local copy is served without re-reading
+    chat_session_flush_interval_seconds: float = 0.5  # mongo: write-behind batching interval
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
 settings = Settings()
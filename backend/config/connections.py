@@ -1,117 +1,178 @@
-from pymongo import MongoClient
-from pymongo.errors import PyMongoError
+from pymongo import AsyncMongoClient
+from pymongo.errors import PyMongoError, BulkWriteError
 from urllib.parse import urlparse
 
 
-class MongoConnection:
-    """Handles MongoDB connection and basic database operations"""
+class AsyncMongoConnection:
+    """Handles the MongoDB connection and database operations, without blocking the event loop.
 
-    def __init__(self, uri: str):
+    One instance is shared by the whole process (see main.lifespan). Database and
+    collection handles are verified once and cached, so CRUD helpers cost exactly
+    one server round trip.
+    """
+
+    def __init__(self, uri: str, **client_options):
         self.uri = uri
+        self.client_options = client_options
         self.client = None
-        self.connect()
-        
-    def connect(self):
-        """Establish a connection to MongoDB"""
+        self._databases = {}
+        self._collections = {}
+
+    @classmethod
+    def from_settings(cls, settings):
+        """Build a connection using the pool and timeout options from Settings"""
+        return cls(
+            settings.mongo_connection_string,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            maxIdleTimeMS=settings.mongo_max_idle_time_ms,
+            serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+            connectTimeoutMS=settings.mongo_connect_timeout_ms,
+            socketTimeoutMS=settings.mongo_socket_timeout_ms,
+        )
+
+    async def connect(self, *db_names: str):
+        """Establish a connection to MongoDB and verify the given databases exist"""
         try:
-            self.client = MongoClient(self.uri)
-            self.client.admin.command("ping")  # Test connection
+            if not self.client:
+                self.client = AsyncMongoClient(self.uri, **self.client_options)
+            await self.client.admin.command("ping")  # Test connection
+            if db_names:
+                await self._verify_databases(db_names)
         except PyMongoError as e:
-            raise Exception("Failed to connect to MongoDB.")    
+            raise Exception("Failed to connect to MongoDB.")
 
-    def disconnect(self):
+    async def disconnect(self):
         """Disconnect from MongoDB"""
         if self.client:
-            self.client.close()
+            await self.client.close()
+            self.client = None
+            self._databases.clear()
+            self._collections.clear()
         else:
             raise Exception("Not connected to MongoDB")
 
-    def get_db(self, db_name: str):
+    async def _verify_databases(self, db_names):
+        """Check the databases exist (one round trip) and cache their handles"""
+        db_list = await self.client.list_database_names()
+        for db_name in db_names:
+            if db_name not in db_list:
+                raise Exception(f"Database '{db_name}' does not exist")
+            self._databases[db_name] = self.client[db_name]
+
+    async def get_db(self, db_name: str):
         """Retrieve the specified database"""
+        db = self._databases.get(db_name)
+        if db is not None:
+            return db
+
         if not self.client:
             raise Exception("Not connected to MongoDB")
 
-        # Check if the database exists
-        db_list = self.client.list_database_names()
-        if db_name not in db_list:
-            raise Exception(f"Database '{db_name}' does not exist")
+        # Databases not verified at startup are checked once, then cached
+        await self._verify_databases([db_name])
+        return self._databases[db_name]
 
-        return self.client[db_name]
-
-        
-    def get_collection(self, db_name: str, collection_name: str):
+    async def get_collection(self, db_name: str, collection_name: str):
         """Retrieve the specified collection"""
-        db = self.get_db(db_name)
-        return db[collection_name]
-    
-    def get_document(self, db_name: str, collection_name: str, query: dict):
+        key = (db_name, collection_name)
+        collection = self._collections.get(key)
+        if collection is None:
+            db = await self.get_db(db_name)
+            collection = self._collections[key] = db[collection_name]
+        return collection
+
+    async def get_document(self, db_name: str, collection_name: str, query: dict):
         """Retrieve a single document from a collection"""
-        db = self.get_db(db_name)
-        collection = db[collection_name]
-        return collection.find_one(query)
+        collection = await self.get_collection(db_name, collection_name)
+        return await collection.find_one(query)
 
-    def insert_document(self, db_name: str, collection_name: str, document: dict):
+    async def insert_document(self, db_name: str, collection_name: str, document: dict):
         """Insert a document into a collection"""
-        db = self.get_db(db_name)
-        collection = db[collection_name]
-        result = collection.insert_one(document)
+        collection = await self.get_collection(db_name, collection_name)
+        result = await collection.insert_one(document)
         return str(result.inserted_id)
 
-    def find_documents(self, db_name: str, collection_name: str, query: dict):
-        """Retrieve documents from a collection with proper ObjectId handling."""
-        collection = self.get_db(db_name)[collection_name]
-        return list(collection.find(query))
+    async def insert_document_if_absent(self, db_name: str, collection_name: str, query: dict, document: dict):
+        """Insert the document in one atomic upsert unless a document matches the query; True if inserted"""
+        collection = await self.get_collection(db_name, collection_name)
+        result = await collection.update_one(query, {"$setOnInsert": document}, upsert=True)
+        return result.upserted_id is not None
 
+    async def find_documents(self, db_name: str, collection_name: str, query: dict, sort: list = None, limit: int = 0,
+                             projection: dict = None):
+        """Retrieve documents from a collection, optionally sorted, limited and projected"""
+        collection = await self.get_collection(db_name, collection_name)
+        return await collection.find(query, projection, sort=sort, limit=limit).to_list(None)
 
+    async def iter_documents(self, db_name: str, collection_name: str, query: dict, sort: list = None, limit: int = 0,
+                             projection: dict = None):
+        """Yield documents one at a time as the cursor produces them (constant memory)"""
+        collection = await self.get_collection(db_name, collection_name)
+        async for document in collection.find(query, projection, sort=sort, limit=limit):
+            yield document
 
-    def delete_document(self, db_name: str, collection_name: str, query: dict):
+    async def bulk_write(self, db_name: str, collection_name: str, operations: list, ordered: bool = False):
+        """
+        Apply a batch of write operations in as few round trips as possible.
+
+        Returns the raw bulk API result (nInserted, upserted, writeErrors, ...), also
+        when some operations failed, so callers can report per-item outcomes.
+        """
+        collection = await self.get_collection(db_name, collection_name)
+        try:
+            result = await collection.bulk_write(operations, ordered=ordered)
+            return result.bulk_api_result
+        except BulkWriteError as e:
+            return e.details
+
+    async def delete_document(self, db_name: str, collection_name: str, query: dict):
         """Delete a document from a collection"""
-        db = self.get_db(db_name)
-        collection = db[collection_name]
-        result = collection.delete_one(query)
+        collection = await self.get_collection(db_name, collection_name)
+        result = await collection.delete_one(query)
         return result.deleted_count
-    
-    def clear_documents(self, db_name: str, collection_name: str, filter_query: dict):
+
+    async def delete_and_return_document(self, db_name: str, collection_name: str, query: dict):
+        """Delete a single document and return it (None if nothing matched)"""
+        collection = await self.get_collection(db_name, collection_name)
+        return await collection.find_one_and_delete(query)
+
+    async def clear_documents(self, db_name: str, collection_name: str, filter_query: dict):
         """Clear documents matching the filter from a collection"""
-        db = self.get_db(db_name)
-        collection = db[collection_name]
-        return collection.delete_many(filter_query)
-    
-    def update_document(self, db_name: str, collection_name: str, query: dict, update: dict):
+        collection = await self.get_collection(db_name, collection_name)
+        return await collection.delete_many(filter_query)
+
+    async def update_document(self, db_name: str, collection_name: str, query: dict, update: dict):
         """Update a document in a collection"""
-        db = self.get_db(db_name)
-        collection = db[collection_name]
-        result = collection.update_many(query, {"$set": update})
+        collection = await self.get_collection(db_name, collection_name)
+        result = await collection.update_many(query, {"$set": update})
         return result.modified_count
 
-    def update_document_element(self, db_name: str, collection_name: str, query: dict, update: dict):
+    async def update_document_element(self, db_name: str, collection_name: str, query: dict, update: dict):
         """Update a document in a collection"""
-        db = self.get_db(db_name)
-        collection = db[collection_name]
-        result = collection.update_one(query, {"$set": update})
+        collection = await self.get_collection(db_name, collection_name)
+        result = await collection.update_one(query, {"$set": update})
         return result.modified_count
-    # Update the MongoDB helper method to return the updated document
-    def update_and_return_document(self, db_name: str, collection_name: str, query: dict, update_fields: dict):
+
+    async def update_and_return_document(self, db_name: str, collection_name: str, query: dict, update_fields: dict):
         """
         Update multiple fields in a document and return the updated document.
 
         """
-        db = self.get_db(db_name)
-        collection = db[collection_name]
-    
-        result = collection.find_one_and_update(
+        collection = await self.get_collection(db_name, collection_name)
+
+        result = await collection.find_one_and_update(
             query,
             {"$set": update_fields},
             return_document=True  # Return the document after the update
         )
-    
+
         if not result:
             return Exception("Document not found or update failed")
-        
+
         return result
-    
-    def find_one_document(self, db_name: str, collection_name: str, query: dict):
+
+    async def find_one_document(self, db_name: str, collection_name: str, query: dict):
         """Find a single document in a collection based on the query"""
-        db = self.get_db(db_name)
-        collection = db[collection_name]
-        return collection.find_one(query)
+        collection = await self.get_collection(db_name, collection_name)
+        return await collection.find_one(query)
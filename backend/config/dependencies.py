@@ -0,0 +1,7 @@
+from fastapi import Request
+from config.connections import AsyncMongoConnection
+
+
+def get_mongo_connection(request: Request) -> AsyncMongoConnection:
+    """FastAPI dependency returning the process-wide Mongo connection created in lifespan"""
+    return request.app.state.mongo
@@ -0,0 +1,117 @@
+import logging
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import PyMongoError
+
+# Indexes backing the hot queries in routes/coordinateRoutes.py
+COORDINATE_INDEXES = [
+    IndexModel([("guild_id", ASCENDING), ("coordinateName", ASCENDING)], name="guild_id_coordinateName"),
+    IndexModel([("guild_id", ASCENDING), ("dimension", ASCENDING)], name="guild_id_dimension"),
+    IndexModel([("guild_id", ASCENDING), ("created_at", ASCENDING)], name="guild_id_created_at"),
+    # Keyset pagination of a guild's coordinates (GET /coordinates/{guild_id}?limit=&after=)
+    IndexModel([("guild_id", ASCENDING), ("_id", ASCENDING)], name="guild_id__id"),
+    # Keyset pagination in dimension order (GET /coordinates/{guild_id}?sort=dimension)
+    IndexModel([("guild_id", ASCENDING), ("dimension", ASCENDING), ("_id", ASCENDING)], name="guild_id_dimension__id"),
+]
+
+# Chat sessions (minecraft_assistant/sessionStore.py): Mongo drops sessions idle past the TTL
+def session_indexes(idle_ttl_seconds: int) -> list[IndexModel]:
+    return [IndexModel([("updated_at", ASCENDING)], name="updated_at_ttl", expireAfterSeconds=idle_ttl_seconds)]
+
+
+# Index options that change behaviour, compared between the declared and existing index
+INDEX_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+
+def _key_of(spec) -> tuple:
+    """
+    Normalise an index key spec to a hashable ((field, direction), ...) tuple.
+
+    Directions are kept as stored: 1 and 1.0 compare equal, and special index
+    types ("text", "2dsphere", "hashed") are plain strings.
+    """
+    items = spec.items() if hasattr(spec, "items") else spec
+    return tuple((field, direction) for field, direction in items)
+
+
+def _options_of(spec: dict) -> dict:
+    """The INDEX_OPTIONS set on an index (False/absent are the same)"""
+    return {option: spec[option] for option in INDEX_OPTIONS if spec.get(option) not in (None, False)}
+
+
+async def _reconcile(collection, index: IndexModel, name: str, info: dict, logger: logging.Logger) -> bool:
+    """
+    Bring an existing index with the declared keys in line with the declared options.
+
+    A changed TTL is applied in place with collMod; any other difference drops the
+    index, and True is returned so it is created again.
+    """
+    declared, current = _options_of(index.document), _options_of(info)
+    logger.warning(f"Index '{name}' on '{collection.name}' has options {current}, declared {declared}")
+    ttl_only = {option for option in INDEX_OPTIONS if declared.get(option) != current.get(option)} == {"expireAfterSeconds"}
+    if ttl_only and "expireAfterSeconds" in declared and "expireAfterSeconds" in current:
+        await collection.database.command(
+            "collMod", collection.name,
+            index={"keyPattern": dict(index.document["key"]), "expireAfterSeconds": declared["expireAfterSeconds"]},
+        )
+        return False
+    await collection.drop_index(name)
+    return True
+
+
+async def ensure_indexes(collection, indexes: list[IndexModel], logger: logging.Logger):
+    """
+    Create any declared index missing from the collection and log index health.
+
+    Indexes are matched on their key pattern rather than their name, so an index
+    created by hand with the same keys is treated as present. An existing index
+    whose options (TTL, unique, ...) differ from the declaration is updated, or
+    dropped and recreated.
+    """
+    try:
+        existing = await collection.index_information()
+        existing_keys = {_key_of(info["key"]): (name, info) for name, info in existing.items()}
+
+        missing = []
+        for index in indexes:
+            found = existing_keys.get(_key_of(index.document["key"]))
+            if found is None:
+                missing.append(index)
+            elif _options_of(found[1]) != _options_of(index.document):
+                if await _reconcile(collection, index, *found, logger):
+                    missing.append(index)
+        if missing:
+            names = [index.document["name"] for index in missing]
+            logger.warning(f"Missing indexes on '{collection.name}': {names}, creating them...")
+            await collection.create_indexes(missing)
+        else:
+            logger.info(f"All {len(indexes)} declared indexes present on '{collection.name}'")
+
+        declared_keys = {_key_of(index.document["key"]) for index in indexes}
+        for key, (name, _) in existing_keys.items():
+            if name != "_id_" and key not in declared_keys:
+                logger.info(f"Index '{name}' on '{collection.name}' is not declared")
+    except PyMongoError as e:
+        logger.error(f"Failed to verify indexes on '{collection.name}': {e}")
+        return
+
+    await log_unused_indexes(collection, logger)
+
+
+async def log_unused_indexes(collection, logger: logging.Logger):
+    """Log indexes that have not served a single operation since the server started tracking them"""
+    try:
+        cursor = await collection.aggregate([{"$indexStats": {}}])
+        stats = await cursor.to_list(None)
+    except PyMongoError as e:
+        # $indexStats needs extra privileges on some hosted tiers
+        logger.debug(f"Could not read index usage for '{collection.name}': {e}")
+        return
+
+    for stat in stats:
+        if stat["name"] == "_id_":
+            continue
+        accesses = stat.get("accesses", {})
+        if accesses.get("ops", 0) == 0:
+            logger.warning(
+                f"Index '{stat['name']}' on '{collection.name}' unused since {accesses.get('since')}"
+            )
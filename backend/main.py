@@ -4,17 +4,18 @@ from fastapi.responses import HTMLResponse
 from fastapi.concurrency import asynccontextmanager
 import logging
 from rich.logging import RichHandler
-from config.connections import MongoConnection
-from dotenv import load_dotenv
+from config.connections import AsyncMongoConnection
+from config.config import settings
+from config.indexes import COORDINATE_INDEXES, ensure_indexes, session_indexes
 #import routes
 from routes.coordinateRoutes import coordinateRouter
 from routes.botRoutes import chatbotRouter
+from routes.metricsRoutes import metricsRouter
+from minecraft_assistant.chatbot import get_agent, message_history
+import asyncio
 
-# Load environment variables from .env file
-load_dotenv()
-mongoConnectionString = os.getenv("mongoConnectionString")
-# Initialize MongoDB connection with the URI loaded from environment variables
-mongoConnection = MongoConnection(mongoConnectionString)  # Update this URI to your MongoDB connection string
+# Single process-wide MongoDB connection (pooled); routers receive it through config.dependencies
+mongoConnection = AsyncMongoConnection.from_settings(settings)
 # Lifespan context manager for handling MongoDB connection at startup and shutdown
 #set up logger
 # Configure logging
@@ -31,20 +32,39 @@ logger = logging.getLogger("uvicorn.error")  # Uses uvicorn's logger
 async def lifespan(app: FastAPI):
     """Handle MongoDB connection at startup and shutdown."""
     try:
-        mongoConnection.connect()  # Connect to MongoDB
+        await mongoConnection.connect(settings.mongo_db_name)  # Connect and verify the database once
+        app.state.mongo = mongoConnection
         logger.info("Connected to MongoDB (main)")
-        yield
+        coordinates = await mongoConnection.get_collection(settings.mongo_db_name, settings.mongo_coordinates_collection)
+        await ensure_indexes(coordinates, COORDINATE_INDEXES, logger)
+        # Build the chatbot agent (prompt, LLM client, tools) once, off the event loop
+        try:
+            await asyncio.to_thread(get_agent)
+            logger.info("Chatbot agent ready")
+        except Exception as e:
+            logger.warning(f"Could not build the chatbot agent at startup, it will be built on first use: {e}")
+        if settings.chat_session_backend == "mongo":
+            sessions = await mongoConnection.get_collection(settings.mongo_db_name, settings.mongo_sessions_collection)
+            await ensure_indexes(sessions, session_indexes(settings.chat_session_idle_ttl_seconds), logger)
+        # Session expiry (and write-behind for the mongo backend) run on this event loop
+        await message_history.start(mongo=mongoConnection)
+        try:
+            yield
+        finally:
+            await message_history.close()
     except Exception as e:
         logger.error(f"Error connecting to MongoDB: {e}")
         raise e
     finally:
         logger.info("Disconnecting from MongoDB...")
-        mongoConnection.disconnect()  # Disconnect from MongoDB
+        if mongoConnection.client:
+            await mongoConnection.disconnect()  # Disconnect from MongoDB
 
 # Initialize FastAPI app and register lifespan context manager
 app = FastAPI(lifespan=lifespan)
 app.include_router(coordinateRouter)
 app.include_router(chatbotRouter, tags=["Chatbot"])
+app.include_router(metricsRouter, tags=["Metrics"])
 
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
@@ -1,17 +1,235 @@
-from typing import List, Dict, Any
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Awaitable, Callable, List, Dict, Any, Optional
+
+logger = logging.getLogger("uvicorn.error")
+
+# summarizer(previous summary, messages to fold in) -> new summary
+Summarizer = Callable[[str, List[Dict[str, Any]]], Awaitable[str]]
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token), good enough for budgeting"""
+    return len(text) // 4 + 1
+
+def format_message(message: Dict[str, Any]) -> str:
+    role = "Human" if message["role"] == "human" else "Assistant"
+    return f"{role}: {message['content']}"
+
+class Session:
+    """
+    One conversation: a running summary of its older turns, its recent messages,
+    their estimated token count and the recent messages already formatted for the prompt.
+    """
+
+    __slots__ = ("messages", "summary", "formatted", "tokens", "last_access")
+
+    def __init__(self, max_messages: int):
+        self.messages: deque = deque(maxlen=max_messages)
+        self.summary = ""
+        self.formatted = ""  # "Human: ...\nAssistant: ..." for `messages`, maintained on append/drop
+        self.tokens = 0
+        self.last_access = time.monotonic()
 
 class MessageHistory:
-    """Message history manager for maintaining conversation context."""
-    
-    def __init__(self):
-        self.history: Dict[str, List[Dict[str, Any]]] = {}
-        
+    """
+    Message history manager for maintaining conversation context.
+
+    Each session keeps at most `max_messages` messages and `max_session_tokens`
+    estimated tokens (oldest messages are dropped first, O(1) per message).
+    Sessions idle for `idle_ttl` seconds expire, and the least recently used
+    sessions are evicted while all sessions together exceed `max_total_tokens`.
+    `start()` (from the app's lifespan) runs the expiry of idle sessions as a
+    task on the app's event loop; `close()` stops it.
+
+    With a `summarizer`, a session over `summary_budget` tokens has its older
+    messages (all but the `keep_recent` newest) folded into a running summary by
+    a background task, so the prompt stays about the same size however long the
+    conversation gets. `formatted_history()` returns the summary and the recent
+    messages as prompt text, kept up to date incrementally.
+
+    This is the in-memory session backend; see sessionStore.py for the others.
+    """
+
+    def __init__(self, max_messages: int = 20, max_session_tokens: int = 2000,
+                 idle_ttl: float = 1800, max_total_tokens: int = 2_000_000, expiry_interval: float = 60,
+                 summary_budget: int = 800, keep_recent: int = 4, summarizer: Optional[Summarizer] = None):
+        self.max_messages = max_messages
+        self.max_session_tokens = max_session_tokens
+        self.idle_ttl = idle_ttl
+        self.max_total_tokens = max_total_tokens
+        self.expiry_interval = expiry_interval
+        self.summary_budget = summary_budget
+        self.keep_recent = keep_recent
+        self.summarizer = summarizer
+        self._tasks: List[asyncio.Task] = []
+        self._compacting: Dict[str, asyncio.Task] = {}
+        self.compactions = 0
+        # Least recently used session first
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self.total_tokens = 0
+        self.expired = 0
+        self.evicted = 0
+
+    async def start(self, mongo=None) -> None:
+        """Start the background maintenance tasks on the running event loop"""
+        self._tasks.append(asyncio.create_task(self.run_expiry(self.expiry_interval)))
+
+    async def close(self) -> None:
+        for task in [*self._tasks, *self._compacting.values()]:
+            task.cancel()
+        self._tasks.clear()
+        self._compacting.clear()
+
+    async def load(self, session_id: str) -> None:
+        """Make the session's messages available to get_messages (always local here)"""
+
     def get_messages(self, session_id: str) -> List[Dict[str, Any]]:
         """Get message history for a session."""
-        return self.history.get(session_id, [])
-        
+        session = self._touch(session_id)
+        return list(session.messages) if session is not None else []
+
+    def formatted_history(self, session_id: str) -> str:
+        """The session as prompt text: the running summary, then the recent messages"""
+        session = self._touch(session_id)
+        if session is None:
+            return ""
+        if session.summary:
+            return f"Summary of the earlier conversation: {session.summary}\n{session.formatted}"
+        return session.formatted
+
     def add_message(self, session_id: str, message: Dict[str, Any]) -> None:
         """Add a message to the session history."""
-        if session_id not in self.history:
-            self.history[session_id] = []
-        self.history[session_id].append(message)
\ No newline at end of file
+        session = self._get_or_create(session_id)
+
+        # A full deque drops its oldest message on append, take it off the count first
+        if len(session.messages) == session.messages.maxlen:
+            self._drop_oldest(session)
+        session.messages.append(message)
+        line = format_message(message)
+        session.formatted = f"{session.formatted}\n{line}" if session.formatted else line
+        tokens = estimate_tokens(message.get("content", ""))
+        session.tokens += tokens
+        self.total_tokens += tokens
+
+        # Keep at least the newest message, even if it alone is over the cap
+        while session.tokens > self.max_session_tokens and len(session.messages) > 1:
+            self._drop_oldest(session)
+
+        while self.total_tokens > self.max_total_tokens and len(self.sessions) > 1:
+            self._remove(next(iter(self.sessions)))
+            self.evicted += 1
+
+        self._maybe_compact(session_id, session)
+
+    def clear(self, session_id: Optional[str] = None) -> None:
+        """Forget one session, or every session"""
+        if session_id is None:
+            self.sessions.clear()
+            self.total_tokens = 0
+        elif session_id in self.sessions:
+            self._remove(session_id)
+
+    def expire_idle(self) -> int:
+        """Remove sessions idle for longer than the TTL; returns how many were removed"""
+        cutoff = time.monotonic() - self.idle_ttl
+        removed = 0
+        # Sessions are in access order, so the idle ones are all at the front
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if session.last_access > cutoff:
+                break
+            self._remove(session_id)
+            removed += 1
+        self.expired += removed
+        return removed
+
+    async def run_expiry(self, interval: float = 60) -> None:
+        """Expire idle sessions every `interval` seconds until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            self.expire_idle()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sessions": len(self.sessions),
+            "total_tokens": self.total_tokens,
+            "max_total_tokens": self.max_total_tokens,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "compactions": self.compactions,
+        }
+
+    def _maybe_compact(self, session_id: str, session: Session) -> None:
+        """Start folding older messages into the summary once the session is over budget"""
+        if (self.summarizer is None or session_id in self._compacting
+                or session.tokens <= self.summary_budget or len(session.messages) <= self.keep_recent):
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._compact(session_id, session))
+        except RuntimeError:
+            return  # no event loop (e.g. a script), keep the messages as they are
+        self._compacting[session_id] = task
+
+    async def _compact(self, session_id: str, session: Session) -> None:
+        folded = list(islice(session.messages, len(session.messages) - self.keep_recent))
+        try:
+            summary = await self.summarizer(session.summary, folded)
+        except Exception as e:
+            logger.warning(f"Failed to summarize chat session {session_id}: {e}")
+            return
+        finally:
+            self._compacting.pop(session_id, None)
+
+        if self.sessions.get(session_id) is not session:
+            return  # expired, evicted or reloaded meanwhile
+        # Drop the folded messages that are still at the front (the caps may have trimmed some)
+        for message in folded:
+            if not session.messages or session.messages[0] is not message:
+                break
+            self._drop_oldest(session)
+        self._set_summary(session, summary)
+        self.compactions += 1
+        self._on_compacted(session_id)
+
+    def _on_compacted(self, session_id: str) -> None:
+        """Hook for persistent backends: the session's messages and summary were rewritten"""
+
+    def _get_or_create(self, session_id: str) -> Session:
+        session = self._touch(session_id)
+        if session is None:
+            session = self.sessions[session_id] = Session(self.max_messages)
+        return session
+
+    def _set_summary(self, session: Session, summary: str) -> None:
+        tokens = (estimate_tokens(summary) if summary else 0) - (estimate_tokens(session.summary) if session.summary else 0)
+        session.summary = summary
+        session.tokens += tokens
+        self.total_tokens += tokens
+
+    def _touch(self, session_id: str) -> Optional[Session]:
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None
+        if session.last_access < time.monotonic() - self.idle_ttl:
+            # Idle past the TTL but not collected yet
+            self._remove(session_id)
+            self.expired += 1
+            return None
+        session.last_access = time.monotonic()
+        self.sessions.move_to_end(session_id)
+        return session
+
+    def _drop_oldest(self, session: Session) -> None:
+        message = session.messages.popleft()
+        # The formatted text starts with this message's line (plus a newline if more follow)
+        session.formatted = session.formatted[len(format_message(message)) + 1:]
+        tokens = estimate_tokens(message.get("content", ""))
+        session.tokens -= tokens
+        self.total_tokens -= tokens
+
+    def _remove(self, session_id: str) -> None:
+        session = self.sessions.pop(session_id)
+        self.total_tokens -= session.tokens
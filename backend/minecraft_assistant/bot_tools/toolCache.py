@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import re
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from langchain.tools import Tool
+from langchain_core.tools import BaseTool, ToolException
+
+from config.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows: no lock file, run a single worker when tool_cache_path is set
+    fcntl = None
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def normalize_query(query: Any) -> str:
+    """Case, spacing and surrounding quotes/punctuation do not change a search"""
+    text = " ".join(str(query).lower().split())
+    return re.sub(r"^[\s\"'`.,;:!?]+|[\s\"'`.,;:!?]+$", "", text)
+
+
+# Tools that catch their own errors return them as text, e.g. "HTTPError('429 Client Error ...')"
+EXCEPTION_REPR = re.compile(r"^\w+(Error|Exception|Timeout)\(")
+
+
+def is_tool_result(result: Any) -> bool:
+    """Default check of what is worth caching: a non-empty result that is not an error repr"""
+    if result is None or result == "" or result == []:
+        return False
+    return not (isinstance(result, str) and EXCEPTION_REPR.match(result))
+
+
+class ToolResultCache:
+    """
+    Results of the chatbot's tools keyed on (tool name, normalized query).
+
+    Entries live in an in-memory LRU bounded by `max_entries`, each with the TTL
+    of the tool that produced it. With `path` set, results are also written to a
+    shelve file and read back on a memory miss, so they survive restarts; expired
+    disk entries are dropped when the file is opened or read. Tools run in worker
+    threads, so memory and file each have their own lock: a slow disk read or sync
+    never holds up a memory lookup made on the event loop.
+
+    A dbm file must not be shared between processes: with several API workers only
+    the first one to open `path` (it holds an exclusive lock file) persists
+    results, the others cache in memory only.
+    """
+
+    def __init__(self, max_entries: int, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk = None
+        self._disk_owner = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path:
+            self._open_disk(path)
+
+    def _open_disk(self, path: str):
+        self._disk_owner = open(f"{path}.lock", "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._disk_owner, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                logger.warning(f"Tool cache file {path} is in use by another worker, caching in memory only")
+                self._disk_owner.close()
+                self._disk_owner = None
+                return
+        self._disk = shelve.open(path)
+        now = time.time()
+        for key in [key for key, (expires_at, _) in self._disk.items() if expires_at < now]:
+            del self._disk[key]
+
+    @property
+    def persistent(self) -> bool:
+        return self._disk is not None
+
+    @staticmethod
+    def _key(tool_name: str, query: Any) -> str:
+        return f"{tool_name}\x00{normalize_query(query)}"
+
+    def get(self, tool_name: str, query: Any) -> Tuple[bool, Any]:
+        """(True, result) on a hit, (False, None) otherwise; reads the shelve file on a memory miss"""
+        hit, result = self.get_memory(tool_name, query)
+        if hit or not self.persistent:
+            return hit, result
+        return self.get_disk(tool_name, query)
+
+    def get_memory(self, tool_name: str, query: Any) -> Tuple[bool, Any]:
+        """Memory-only lookup, safe on the event loop (a miss is only counted without a file to check)"""
+        key = self._key(tool_name, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            if not self.persistent:
+                self.misses += 1
+            return False, None
+
+    def get_disk(self, tool_name: str, query: Any) -> Tuple[bool, Any]:
+        """Shelve file lookup after a memory miss; blocking, run it in a worker thread from async code"""
+        key = self._key(tool_name, query)
+        with self._disk_lock:
+            entry = self._disk.get(key)
+            if entry is not None and entry[0] < time.time():
+                del self._disk[key]
+                entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.disk_hits += 1
+            self.hits += 1
+            self._store(key, entry)
+            return True, entry[1]
+
+    def put(self, tool_name: str, query: Any, result: Any, ttl: float):
+        """Store a result (and sync it to the shelve file: blocking when persistent)"""
+        key = self._key(tool_name, query)
+        entry = (time.time() + ttl, result)
+        with self._lock:
+            self._store(key, entry)
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk[key] = entry
+                self._disk.sync()
+
+    def _store(self, key: str, entry: Tuple[float, Any]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "persistent": self.persistent,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+tool_cache = ToolResultCache(max_entries=settings.tool_cache_max_entries, path=settings.tool_cache_path)
+
+
+def cached_tool(tool: BaseTool, ttl: float, cache: ToolResultCache = tool_cache,
+                is_result: Callable[[Any], bool] = is_tool_result) -> Tool:
+    """
+    The same tool (name, description, single text input) with its results cached for `ttl` seconds.
+
+    Only outputs accepted by `is_result` are cached: empty results, errors the tool
+    returned as text and ToolException failures (e.g. a timeout, returned to the
+    agent as the observation) are retried next time instead.
+    """
+    def run(query: str):
+        hit, result = cache.get(tool.name, query)
+        if hit:
+            return result
+        try:
+            result = tool.invoke(query)
+        except ToolException as e:
+            return str(e)
+        if is_result(result):
+            cache.put(tool.name, query, result, ttl)
+        return result
+
+    async def arun(query: str):
+        hit, result = cache.get_memory(tool.name, query)
+        if not hit and cache.persistent:
+            hit, result = await asyncio.to_thread(cache.get_disk, tool.name, query)
+        if hit:
+            return result
+        try:
+            result = await tool.ainvoke(query)
+        except ToolException as e:
+            return str(e)
+        if is_result(result):
+            if cache.persistent:
+                # Writing through to the shelve file syncs it to disk, keep that off the event loop
+                await asyncio.to_thread(cache.put, tool.name, query, result, ttl)
+            else:
+                cache.put(tool.name, query, result, ttl)
+        return result
+
+    return Tool(name=tool.name, description=tool.description, func=run, coroutine=arun)
@@ -1,5 +1,15 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import yt_dlp
 from langchain.tools import Tool
+from langchain_core.tools import ToolException
+from config.config import settings
+
+# yt_dlp is blocking, so searches run on a small dedicated pool, never on the event loop
+youtube_executor = ThreadPoolExecutor(max_workers=settings.youtube_max_concurrency, thread_name_prefix="youtube")
+youtube_slots = asyncio.Semaphore(settings.youtube_max_concurrency)
+NO_VIDEOS_FOUND = "No videos found."
+
 def youtube_search(query: str) -> str:
     """
     Search YouTube for videos based on the provided query.
@@ -12,6 +22,7 @@ def youtube_search(query: str) -> str:
             'quiet': True,
             'no_warnings': True,
             'extract_flat': True,
+            'socket_timeout': settings.youtube_socket_timeout_seconds,
         }
         
         search_query = f"ytsearch5:{search_term}"
@@ -36,7 +47,7 @@ def youtube_search(query: str) -> str:
                             f"   URL: {url}\n"
                         )
                 
-                return "\n".join(formatted_results) if formatted_results else "No videos found."
+                return "\n".join(formatted_results) if formatted_results else NO_VIDEOS_FOUND
     
     except ImportError:
         pass
@@ -76,10 +87,34 @@ def youtube_search(query: str) -> str:
         else:
             print(f"YouTube search failed: {e}")
             
+async def youtube_search_async(query: str) -> str:
+    """
+    youtube_search off the event loop, with at most `youtube_max_concurrency`
+    searches at once and a hard deadline. Cancelling the caller (e.g. the request
+    was abandoned) stops waiting right away; the worker thread finishes on its own,
+    bounded by the socket timeout.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def search_in_pool():
+        async with youtube_slots:
+            return await loop.run_in_executor(youtube_executor, youtube_search, query)
+
+    try:
+        # The deadline covers waiting for a free slot as well
+        return await asyncio.wait_for(search_in_pool(), timeout=settings.youtube_search_timeout_seconds)
+    except asyncio.TimeoutError:
+        raise ToolException("YouTube search timed out. Try TavilySearchResults instead.")
+
+def is_youtube_result(result) -> bool:
+    """Videos were found (failed or empty searches return None or NO_VIDEOS_FOUND)"""
+    return bool(result) and result != NO_VIDEOS_FOUND
+
 # Create YouTube tool
 youtube_tool = Tool(
     name="YouTubeSearch",
     func=youtube_search,
+    coroutine=youtube_search_async,
     description=(
         "Search YouTube for videos on any topic. "
         "Input should be a search query like 'Minecraft netherite farm tutorial' or 'redstone contraptions'. "
@@ -2,33 +2,70 @@ from langchain_community.chat_models import ChatOllama
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain import hub
+from langchain_core.load import dumps, loads
 import re
 from dotenv import load_dotenv, find_dotenv
 import asyncio
+import logging
 import os
-from minecraft_assistant import MessageHistory
-from minecraft_assistant.bot_tools.youtubeTool import youtube_tool
+from minecraft_assistant.sessionStore import create_message_history
+from minecraft_assistant.MessageHistory import format_message
+from minecraft_assistant.bot_tools.youtubeTool import youtube_tool, is_youtube_result
+from minecraft_assistant.bot_tools.toolCache import cached_tool
+from services.answerCache import answer_cache, normalize_question
+from config.config import settings
+from ollama import AsyncClient as OllamaClient
 from pydantic import BaseModel
 from typing import Optional
-from apscheduler.schedulers.background import BackgroundScheduler
-from datetime import datetime
 import time
+import threading
+
+logger = logging.getLogger("uvicorn.error")
 
 # Load environment variables
 load_dotenv(find_dotenv())
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+REACT_PROMPT = "hwchase17/react"
+# The hub prompt is pulled once and kept here so later (cold) starts work offline.
+# Delete the file to pull a fresh copy.
+PROMPT_CACHE_PATH = os.getenv(
+    "PROMPT_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".prompt_cache", "hwchase17_react.json")
+)
 
 class ChatResponse(BaseModel):
     answer: Optional[str] = None
     urls: Optional[list[str]] = None
 
+def load_react_prompt():
+    """The ReAct prompt from the on-disk cache, pulling it from the hub (and caching it) on a miss"""
+    try:
+        with open(PROMPT_CACHE_PATH, "r", encoding="utf-8") as file:
+            return loads(file.read())
+    except (OSError, ValueError):
+        pass
+
+    prompt = hub.pull(REACT_PROMPT)
+    try:
+        os.makedirs(os.path.dirname(PROMPT_CACHE_PATH), exist_ok=True)
+        with open(PROMPT_CACHE_PATH, "w", encoding="utf-8") as file:
+            file.write(dumps(prompt))
+    except OSError as e:
+        logger.warning(f"Could not cache the prompt at {PROMPT_CACHE_PATH}: {e}")
+    return prompt
+
 def create_agent() -> AgentExecutor:
     llm = ChatOllama(model="mistral", temperature=0, base_url=OLLAMA_BASE_URL)
     
-    tools = [TavilySearchResults(max_results=3), youtube_tool]
+    # Repeated searches are answered from the tool result cache. Tavily returns its
+    # API errors as text (the exception's repr), a real result is a list of hits
+    tools = [
+        cached_tool(TavilySearchResults(max_results=3), settings.web_search_cache_ttl_seconds,
+                    is_result=lambda result: isinstance(result, list) and bool(result)),
+        cached_tool(youtube_tool, settings.youtube_cache_ttl_seconds, is_result=is_youtube_result),
+    ]
     
     # Get prompt and add custom instructions
-    prompt = hub.pull("hwchase17/react")
+    prompt = load_react_prompt()
     custom_instructions = f"""You are Kami, a Minecraft expert AI assistant.
 
 Instructions:
@@ -44,19 +81,51 @@ Instructions:
     
     return AgentExecutor(agent=agent, tools=tools, verbose=True, handle_parsing_errors=True)
 
+# The agent holds no per-conversation state (history is passed in the input), so one
+# executor, LLM client and tool set serve every request
+_agent: Optional[AgentExecutor] = None
+_agent_lock = threading.Lock()
+
+def get_agent() -> AgentExecutor:
+    """The shared agent, built on first use (or at startup, see main.lifespan)"""
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                _agent = create_agent()
+    return _agent
+
+async def aget_agent() -> AgentExecutor:
+    """get_agent() for request handlers: a first build (prompt pull included) runs in a worker thread"""
+    if _agent is None:
+        return await asyncio.to_thread(get_agent)
+    return _agent
+
 # Chat history management
-message_history = MessageHistory.MessageHistory()
+message_history = create_message_history(settings)  # started/closed in main.lifespan
 
 def format_chat_history(history):
-    if not history:
-        return ""
-    
-    formatted = []
-    for msg in history:
-        role = "Human" if msg["role"] == "human" else "Assistant"
-        formatted.append(f"{role}: {msg['content']}")
-    
-    return "\n".join(formatted)
+    return "\n".join(format_message(msg) for msg in history)
+
+# Long conversations: older turns are folded into a running summary in the background
+SUMMARY_PROMPT = """Summarize this conversation between a Minecraft player (Human) and Kami, a Minecraft assistant (Assistant).
+Update the existing summary with the new messages. Keep names, coordinates, builds, versions and any open questions.
+Reply with the summary only, in at most 120 words.
+
+Existing summary:
+{summary}
+
+New messages:
+{messages}
+"""
+summary_llm = ChatOllama(model="mistral", temperature=0, base_url=OLLAMA_BASE_URL)
+
+async def summarize_history(summary: str, messages: list) -> str:
+    prompt = SUMMARY_PROMPT.format(summary=summary or "(none)", messages=format_chat_history(messages))
+    result = await summary_llm.ainvoke(prompt)
+    return result.content.strip()
+
+message_history.summarizer = summarize_history
 
 def extract_urls_from_text(text: str) -> list[str]:
     """Extract URLs from text using regex"""
@@ -64,41 +133,141 @@ def extract_urls_from_text(text: str) -> list[str]:
     urls = re.findall(url_pattern, text)
     return list(set(urls))  # Remove duplicates
 
+# The ReAct agent's final answer follows this marker in the LLM output
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+def build_agent_input(query: str, session_id: str) -> str:
+    # Summary + recent messages, formatted incrementally as the session changes
+    chat_history_str = message_history.formatted_history(session_id)
+
+    # Include history if it exists
+    return f"Previous conversation:\n{chat_history_str}\n\nCurrent question: {query + '(Minecraft)'}" if chat_history_str else query
+
+def save_exchange(query: str, session_id: str, answer: str):
+    # Save query and answer
+    message_history.add_message(session_id, {"role": "human", "content": query})
+    message_history.add_message(session_id, {"role": "assistant", "content": answer})
+
+def finalize_answer(query: str, session_id: str, raw_answer: str) -> ChatResponse:
+    # Extract URLs first
+    urls = extract_urls_from_text(raw_answer)
+
+    # Always include the URLs at the end of the answer
+    if urls:
+        raw_answer += "\n\nRelevant URL(s):\n" + "\n".join(urls)
+
+    save_exchange(query, session_id, raw_answer)
+    return ChatResponse(answer=raw_answer, urls=urls)
+
+# Semantic answer cache: questions are embedded with Ollama and near-duplicates reuse a past answer
+embedding_client = OllamaClient(host=OLLAMA_BASE_URL)
+
+async def embed_question(query: str):
+    try:
+        result = await embedding_client.embed(model=settings.embedding_model, input=normalize_question(query))
+        return result["embeddings"][0]
+    except Exception as e:
+        logger.warning(f"Embedding failed, skipping the answer cache: {e}")
+        return None
+
+async def lookup_cached_answer(query: str, session_id: str):
+    """
+    (cached ChatResponse or None, question embedding or None).
+
+    Only standalone questions use the cache: with a conversation history the same
+    words can ask something else (e.g. "what about the nether?").
+    """
+    if not settings.answer_cache_enabled or message_history.formatted_history(session_id):
+        return None, None
+
+    cached = answer_cache.lookup_exact(query)
+    vector = None
+    if cached is None:
+        vector = await embed_question(query)
+        if vector is not None:
+            cached = answer_cache.lookup(vector)
+    if cached is None:
+        return None, vector
+
+    save_exchange(query, session_id, cached.answer)
+    return ChatResponse(answer=cached.answer, urls=cached.urls), vector
+
+def cache_answer(vector, query: str, response: ChatResponse):
+    if vector is not None:
+        answer_cache.add(vector, query, response.answer, response.urls)
+
 async def generate_response(query: str, session_id: str) -> ChatResponse:
     try:
-        history = message_history.get_messages(session_id)
-        chat_history_str = format_chat_history(history)
-        
-        # Include history if it exists
-        input_text = f"Previous conversation:\n{chat_history_str}\n\nCurrent question: {query + '(Minecraft)'}" if chat_history_str else query
-        
-        agent = create_agent()
+        await message_history.load(session_id)
+        cached, vector = await lookup_cached_answer(query, session_id)
+        if cached is not None:
+            return cached
+
+        input_text = build_agent_input(query, session_id)
+
+        agent = await aget_agent()
         result = await agent.ainvoke({"input": input_text})
-        
-        # Extract URLs first
-        raw_answer = result["output"]
-        urls = extract_urls_from_text(raw_answer)
-
-        # Always include the URLs at the end of the answer
-        if urls:
-            raw_answer += "\n\nRelevant URL(s):\n" + "\n".join(urls)
-        
-        # Save query and answer
-        message_history.add_message(session_id, {"role": "human", "content": query})
-        message_history.add_message(session_id, {"role": "assistant", "content": raw_answer})
-        
-        return ChatResponse(answer=raw_answer, urls=urls)
+
+        response = finalize_answer(query, session_id, result["output"])
+        cache_answer(vector, query, response)
+        return response
     
     except Exception as e:
         error_msg = f"Error processing request: {str(e)}"
         return ChatResponse(answer=error_msg, urls=[])
 
-# Daily Memory Wipe Scheduler
-def clear_memory():
-    """Clear all chat sessions at midnight"""
-    print(f"[{datetime.now()}] Clearing all chat sessions.")
-    message_history._store = {}  # Adjust based on how your MessageHistory is implemented
+async def stream_response(query: str, session_id: str):
+    """
+    Run the agent and yield events as they happen:
+
+    - {"type": "tool", "tool": name, "input": ...} when a tool starts
+    - {"type": "token", "text": ...} for each LLM token of the final answer
+    - {"type": "done", "answer": ..., "urls": [...]} once, with the complete answer (`"cached": true` when served from the answer cache)
+    - {"type": "error", "detail": ...} if the agent fails
+    """
+    try:
+        await message_history.load(session_id)
+        cached, vector = await lookup_cached_answer(query, session_id)
+        if cached is not None:
+            yield {"type": "done", "answer": cached.answer, "urls": cached.urls, "cached": True}
+            return
+
+        input_text = build_agent_input(query, session_id)
+        agent = await aget_agent()
+
+        # Text generated so far per LLM call, and how much of it was already sent as tokens
+        generated: dict = {}
+        sent: dict = {}
+        async for event in agent.astream_events({"input": input_text}, version="v2"):
+            kind = event["event"]
 
-scheduler = BackgroundScheduler()
-scheduler.add_job(clear_memory, 'cron', hour=0, minute=0)  # Every day at 00:00
-scheduler.start()
+            if kind == "on_chat_model_stream":
+                run_id = event["run_id"]
+                text = generated.get(run_id, "") + (event["data"]["chunk"].content or "")
+                generated[run_id] = text
+
+                # Only the part after "Final Answer:" is meant for the user
+                marker = text.find(FINAL_ANSWER_MARKER)
+                if marker == -1:
+                    continue
+                start = sent.get(run_id, marker + len(FINAL_ANSWER_MARKER))
+                token = text[start:]
+                if run_id not in sent:
+                    token = token.lstrip()
+                    start = len(text) - len(token)
+                if token:
+                    sent[run_id] = start + len(token)
+                    yield {"type": "token", "text": token}
+
+            elif kind == "on_tool_start":
+                tool_input = event["data"].get("input")
+                yield {"type": "tool", "tool": event["name"], "input": str(tool_input) if tool_input is not None else None}
+
+            elif kind == "on_chain_end" and not event.get("parent_ids"):
+                # End of the AgentExecutor run itself
+                result = finalize_answer(query, session_id, event["data"]["output"]["output"])
+                cache_answer(vector, query, result)
+                yield {"type": "done", "answer": result.answer, "urls": result.urls}
+
+    except Exception as e:
+        yield {"type": "error", "detail": f"Error processing request: {str(e)}"}
@@ -0,0 +1,207 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from pymongo import UpdateOne
+
+from minecraft_assistant.MessageHistory import MessageHistory
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class MongoMessageHistory(MessageHistory):
+    """
+    Chat sessions persisted in MongoDB, shared by every API worker.
+
+    The in-memory MessageHistory this extends is the local read cache: `load()`
+    reads a session from Mongo only when it is not cached locally or the local
+    copy was last read, written or flushed more than `cache_ttl` seconds ago
+    (another worker may have answered since), so the reads within one request
+    and quick follow-ups cost no round trip. Sessions with writes that are queued
+    or in flight are never re-read, as Mongo may still hold an older copy. `add_message()` only touches the cache and queues the message; a
+    background task writes queued messages every `flush_interval` seconds in one
+    unordered bulk write ($push with $slice, so stored sessions stay capped too).
+    Idle sessions are removed by Mongo through a TTL index on `updated_at`.
+    A compaction (older messages folded into the summary) is written as a
+    rewrite of the stored messages and summary instead.
+    """
+
+    def __init__(self, db_name: str, collection_name: str, cache_ttl: float = 10,
+                 flush_interval: float = 0.5, **history_options):
+        super().__init__(**history_options)
+        self.db_name = db_name
+        self.collection_name = collection_name
+        self.cache_ttl = cache_ttl
+        self.flush_interval = flush_interval
+        self.mongo = None
+        self._loaded_at: Dict[str, float] = {}
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        # Compacted sessions, stored as a whole on the next flush: session_id -> {"messages", "summary"}
+        self._rewrites: Dict[str, Dict[str, Any]] = {}
+        self._flushing: set = set()  # sessions whose writes are in the bulk write under way
+        self.loads = 0
+        self.flushes = 0
+        self.flush_errors = 0
+
+    async def start(self, mongo=None) -> None:
+        if mongo is None:
+            raise ValueError("The mongo session backend needs the app's AsyncMongoConnection")
+        self.mongo = mongo
+        await super().start()
+        self._tasks.append(asyncio.create_task(self.run_flusher(self.flush_interval)))
+
+    async def close(self) -> None:
+        await super().close()
+        # Don't lose the last messages on shutdown
+        await self.flush()
+
+    def _unflushed(self, session_id: str) -> bool:
+        return session_id in self._pending or session_id in self._rewrites or session_id in self._flushing
+
+    async def load(self, session_id: str) -> None:
+        if self._unflushed(session_id):
+            # Local changes not (yet) in Mongo: the cache is the newest copy
+            return
+        loaded_at = self._loaded_at.get(session_id)
+        if session_id in self.sessions and loaded_at is not None and time.monotonic() - loaded_at < self.cache_ttl:
+            return
+
+        started = time.monotonic()
+        document = await self.mongo.get_document(self.db_name, self.collection_name, {"_id": session_id})
+        self.loads += 1
+        if self._unflushed(session_id) or self._loaded_at.get(session_id, started) > started:
+            # Changed locally (or reloaded) while reading, keep the local copy
+            return
+        self.clear(session_id)
+        document = document or {}
+        if document.get("summary"):
+            self._set_summary(self._get_or_create(session_id), document["summary"])
+        for message in document.get("messages", []):
+            super().add_message(session_id, message)
+        self._loaded_at[session_id] = time.monotonic()
+
+    def add_message(self, session_id: str, message: Dict[str, Any]) -> None:
+        super().add_message(session_id, message)
+        # Our own write: the local copy is current, no need to re-read it for cache_ttl
+        self._loaded_at[session_id] = time.monotonic()
+        rewrite = self._rewrites.get(session_id)
+        if rewrite is not None:
+            # Goes out with the rewrite, a separate $push could be applied before it
+            rewrite["messages"] = [*rewrite["messages"], message][-self.max_messages:]
+        else:
+            self._pending.setdefault(session_id, []).append(message)
+
+    def _on_compacted(self, session_id: str) -> None:
+        # Taken now: the session may be evicted locally before the next flush
+        session = self.sessions[session_id]
+        self._rewrites[session_id] = {"messages": list(session.messages), "summary": session.summary}
+        # Those messages are part of the rewrite
+        self._pending.pop(session_id, None)
+
+    def expire_idle(self) -> int:
+        removed = super().expire_idle()
+        for session_id in [session_id for session_id in self._loaded_at if session_id not in self.sessions]:
+            del self._loaded_at[session_id]
+        return removed
+
+    async def flush(self) -> None:
+        """Write every queued message (and compacted session) in one bulk write"""
+        if not (self._pending or self._rewrites) or self.mongo is None:
+            return
+        pending, self._pending = self._pending, {}
+        rewrites, self._rewrites = self._rewrites, {}
+        now = datetime.now(timezone.utc)
+        # (session_id, messages, is rewrite) per operation, to re-queue failures
+        operations, queued = [], []
+        for session_id, rewrite in rewrites.items():
+            operations.append(UpdateOne({"_id": session_id}, {"$set": {**rewrite, "updated_at": now}}, upsert=True))
+            queued.append((session_id, rewrite, True))
+        for session_id, messages in pending.items():
+            operations.append(UpdateOne(
+                {"_id": session_id},
+                {
+                    "$push": {"messages": {"$each": messages, "$slice": -self.max_messages}},
+                    "$set": {"updated_at": now},
+                },
+                upsert=True,
+            ))
+            queued.append((session_id, messages, False))
+        if not operations:
+            return
+        # Until the write settles Mongo may still hold the old copy, so load() must not read it
+        flushing = {session_id for session_id, _, _ in queued}
+        self._flushing |= flushing
+        try:
+            result = await self.mongo.bulk_write(self.db_name, self.collection_name, operations, ordered=False)
+            failed = {error["index"] for error in result.get("writeErrors", [])}
+        except asyncio.CancelledError:
+            # Shutting down mid-write: keep the batch for the final flush in close()
+            self._flushing -= flushing
+            self._requeue(queued, set(range(len(operations))))
+            raise
+        except Exception as e:
+            logger.error(f"Failed to write chat sessions: {e}")
+            failed = set(range(len(operations)))
+        self._flushing -= flushing
+
+        self.flushes += 1
+        written_at = time.monotonic()
+        for position, (session_id, _, _) in enumerate(queued):
+            if position not in failed and session_id in self.sessions:
+                self._loaded_at[session_id] = written_at
+        if failed:
+            self.flush_errors += len(failed)
+            self._requeue(queued, failed)
+
+    def _requeue(self, queued: list, failed: set) -> None:
+        """Queue the failed writes again, ahead of anything added meanwhile"""
+        for position, (session_id, queued_write, is_rewrite) in enumerate(queued):
+            if position not in failed:
+                continue
+            if not is_rewrite:
+                if session_id not in self._rewrites:  # a later compaction already holds these messages
+                    self._pending[session_id] = queued_write + self._pending.get(session_id, [])
+            elif session_id not in self._rewrites:
+                # Compacted again meanwhile otherwise, the newer rewrite wins
+                messages = queued_write["messages"] + self._pending.pop(session_id, [])
+                self._rewrites[session_id] = {**queued_write, "messages": messages[-self.max_messages:]}
+
+    async def run_flusher(self, interval: float) -> None:
+        """Flush queued messages every `interval` seconds until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            **super().stats(),
+            "backend": "mongo",
+            "loads": self.loads,
+            "pending_sessions": len(self._pending) + len(self._rewrites),
+            "flushes": self.flushes,
+            "flush_errors": self.flush_errors,
+        }
+
+
+def create_message_history(settings) -> MessageHistory:
+    """The session backend selected by `chat_session_backend` ("memory" or "mongo")"""
+    history_options = dict(
+        max_messages=settings.chat_session_max_messages,
+        max_session_tokens=settings.chat_session_max_tokens,
+        idle_ttl=settings.chat_session_idle_ttl_seconds,
+        max_total_tokens=settings.chat_history_max_total_tokens,
+        expiry_interval=settings.chat_session_expiry_interval_seconds,
+        summary_budget=settings.chat_history_summary_budget_tokens,
+        keep_recent=settings.chat_history_keep_recent_messages,
+    )
+    if settings.chat_session_backend == "mongo":
+        return MongoMessageHistory(
+            settings.mongo_db_name,
+            settings.mongo_sessions_collection,
+            cache_ttl=settings.chat_session_cache_ttl_seconds,
+            flush_interval=settings.chat_session_flush_interval_seconds,
+            **history_options,
+        )
+    return MessageHistory(**history_options)
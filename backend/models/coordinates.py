@@ -1,6 +1,6 @@
 from bson import ObjectId
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+from typing import Optional, Literal, List
 from datetime import datetime
 
 
@@ -60,3 +60,85 @@ class MinecraftCoordinate(BaseModel):
             datetime: lambda v: v.isoformat()
         }
     )
+
+
+class CoordinateProjection(BaseModel):
+    """Partial Minecraft coordinate returned when a read route is called with `fields=`."""
+    id: Optional[PyObjectId] = Field(None, alias="_id")
+    guild_id: Optional[str] = None
+    guild_name: Optional[str] = None
+    channel_id: Optional[str] = None
+    user_id: Optional[str] = None
+    username: Optional[str] = None
+    avatar_url: Optional[str] = None
+    coordinateName: Optional[str] = None
+    coordinates: Optional[CoordinateDetails] = None
+    dimension: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_encoders={
+            ObjectId: str,
+            datetime: lambda v: v.isoformat()
+        }
+    )
+
+
+class BulkCoordinateOperation(BaseModel):
+    """One item of a bulk coordinate write (POST /coordinates/bulk/{guild_id})."""
+    op: Literal["insert", "upsert", "delete"] = "insert"
+    coordinateName: Optional[str] = Field(None, min_length=1, max_length=100)
+    coordinate: Optional[MinecraftCoordinate] = None
+
+    @model_validator(mode="after")
+    def check_operation(self):
+        if self.op == "delete":
+            if not self.coordinateName:
+                raise ValueError("delete operations require coordinateName")
+        elif self.coordinate is None:
+            raise ValueError(f"{self.op} operations require coordinate")
+        else:
+            self.coordinateName = self.coordinate.coordinateName
+        return self
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of a single bulk operation, in request order."""
+    index: int
+    op: Optional[str] = None
+    coordinateName: Optional[str] = None
+    ok: bool
+    id: Optional[str] = None  # inserted or upserted document id
+    error: Optional[str] = None
+
+
+class BulkWriteResponse(BaseModel):
+    """Aggregate counts plus per-item results of a bulk coordinate write."""
+    inserted: int = 0
+    upserted: int = 0
+    matched: int = 0
+    modified: int = 0
+    deleted: int = 0
+    failed: int = 0
+    results: List[BulkItemResult] = []
+
+
+class NearbyCoordinate(BaseModel):
+    """Coordinate returned by a proximity query, with its distance from the query point."""
+    id: str = Field(..., alias="_id")
+    coordinateName: str
+    coordinates: CoordinateDetails
+    dimension: str
+    username: Optional[str] = None
+    distance: float
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class CoordinateSearchHit(BaseModel):
+    """Coordinate name matching a search query, best matches first."""
+    coordinateName: str
+    score: float
+    match: Literal["exact", "prefix", "substring", "fuzzy"]
+    count: int  # coordinates saved under this name
@@ -1,13 +1,53 @@
-from fastapi import APIRouter, HTTPException
-from minecraft_assistant.chatbot import generate_response
+import asyncio
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from minecraft_assistant.chatbot import generate_response, stream_response
 from models.chatbotModels import ChatRequest
+from services.serialization import dumps_ndjson_line
 
 chatbotRouter = APIRouter()
 
+# How often a running answer checks whether its client is still connected
+DISCONNECT_POLL_SECONDS = 1.0
+
+async def cancel_on_disconnect(http_request: Request, coroutine):
+    """
+    Await the coroutine, cancelling it (and the agent/tool calls under it) if the
+    client goes away first, so abandoned questions stop using LLM and tool capacity.
+    """
+    task = asyncio.create_task(coroutine)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await http_request.is_disconnected():
+                raise HTTPException(status_code=499, detail="Client closed the request")
+    finally:
+        task.cancel()
+
 @chatbotRouter.post("/chatbot/{guild_id}/{channel_id}")
-async def chatbot_response(request: ChatRequest):
+async def chatbot_response(request: ChatRequest, http_request: Request):
     try:
-        response = await generate_response(query=request.query, session_id=request.session_id)
+        response = await cancel_on_disconnect(
+            http_request, generate_response(query=request.query, session_id=request.session_id)
+        )
         return response
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def stream_ndjson_events(events):
+    async for event in events:
+        yield dumps_ndjson_line(event)
+
+@chatbotRouter.post("/chatbot/{guild_id}/{channel_id}/stream")
+async def chatbot_stream(request: ChatRequest):
+    """
+    Same as /chatbot/{guild_id}/{channel_id}, but streamed as NDJSON events
+    (tool progress, answer tokens, then a final `done` event with the full answer).
+    The stream is cancelled when the client disconnects.
+    """
+    events = stream_response(query=request.query, session_id=request.session_id)
+    return StreamingResponse(stream_ndjson_events(events), media_type="application/x-ndjson")
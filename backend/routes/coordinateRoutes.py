@@ -1,82 +1,466 @@
-from fastapi import APIRouter, HTTPException
-from models.coordinates import MinecraftCoordinate, CoordinateUpdatePayload
-from config.connections import MongoConnection
-from typing import List
-from dotenv import load_dotenv
-import os
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from models.coordinates import (
+    MinecraftCoordinate, CoordinateUpdatePayload, CoordinateProjection,
+    BulkCoordinateOperation, BulkItemResult, BulkWriteResponse, NearbyCoordinate, CoordinateSearchHit
+)
+from services.spatialIndex import spatial_index
+from services.nameIndex import name_index
+from services.responseCache import response_cache, CachedResponse
+from services.serialization import dumps_document, dumps_documents, dumps_ndjson_line, shape_coordinate
+from config.connections import AsyncMongoConnection
+from config.config import settings
+from config.dependencies import get_mongo_connection
+from typing import List, Literal, Optional, Union
 from pydantic import ValidationError
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import InsertOne, UpdateOne, DeleteOne
+import orjson
+import base64
+import time
 
 # Create fastAPI router
 coordinateRouter = APIRouter()
 
-# Load environment variables
-load_dotenv()
+DB_NAME = settings.mongo_db_name
+COLLECTION_NAME = settings.mongo_coordinates_collection
 
-# Create mongo instance
-mongoConnectionString = os.getenv("mongoConnectionString")
-MongoConnection = MongoConnection(mongoConnectionString)
+MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+PREV_CURSOR_HEADER = "X-Prev-Cursor"
+# Fields a client may request with `fields=` (the _id is always returned)
+PROJECTABLE_FIELDS = set(MinecraftCoordinate.model_fields) - {"id"}
+# Bulk writes are sent to Mongo in batches of this many operations
+BULK_BATCH_SIZE = 1000
+# Proximity queries return at most this many coordinates
+MAX_NEARBY_RESULTS = 100
+MAX_SEARCH_RESULTS = 25
+# Only the fields the in-memory indexes keep are loaded when a guild is first indexed
+INDEX_PROJECTION = {"coordinateName": 1, "coordinates": 1, "dimension": 1, "username": 1}
+# In-memory per-guild indexes kept in sync by the write routes
+GUILD_INDEXES = (spatial_index, name_index)
 
-DB_NAME = "test_db"
-COLLECTION_NAME = "test_coordinates"
+# Projection helper
+def parse_fields(fields: Optional[str]) -> Optional[dict]:
+    """Turn a comma separated `fields=` value into a Mongo projection"""
+    if not fields:
+        return None
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = names - PROJECTABLE_FIELDS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return {name: 1 for name in names}
 
-# Helper function to convert MongoDB documents to Pydantic model
-def mongo_to_pydantic(coord):
-    if '_id' in coord:
-        coord['_id'] = str(coord['_id'])  # Convert ObjectId to string
-    return MinecraftCoordinate(**coord)
+# Keyset pagination helpers. For the default `_id` order the cursor is the _id of the
+# boundary document; for the other orders it is an opaque token carrying the sort key
+# values as well (the raw 12 ObjectId bytes followed by the key, urlsafe base64)
+SORT_FIELDS = {"_id": ("_id",), "dimension": ("dimension", "_id")}
+
+def decode_cursor(cursor: Optional[str], sort: str = "_id") -> Optional[tuple]:
+    if cursor is None:
+        return None
+    if sort == "_id":
+        if not ObjectId.is_valid(cursor):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return (ObjectId(cursor),)
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return (raw[12:].decode(), ObjectId(raw[:12]))
+    except (ValueError, TypeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def encode_cursor(document, sort: str = "_id") -> str:
+    if sort == "_id":
+        return str(document["_id"])
+    raw = document["_id"].binary + str(document.get(sort) or "").encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def keyset_filter(fields: tuple, values: tuple, operator: str) -> dict:
+    """Filter for documents strictly after (`$gt`) or before (`$lt`) a position in a compound order"""
+    clauses = []
+    for position, field in enumerate(fields):
+        clause = dict(zip(fields[:position], values[:position]))
+        clause[field] = {operator: values[position]}
+        clauses.append(clause)
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+async def stream_ndjson(documents, projected: bool):
+    """Serialize documents one line at a time as the Mongo cursor yields them"""
+    async for coord in documents:
+        yield dumps_ndjson_line(shape_coordinate(coord, projected))
+
+async def list_coordinates(mongo: AsyncMongoConnection, response: Response, query: dict,
+                           limit: Optional[int], after: Optional[str], stream: bool, projection: Optional[dict],
+                           before: Optional[str] = None, sort: str = "_id"):
+    """Shared implementation of the listing routes (optionally paginated and/or streamed)"""
+    if after is not None and before is not None:
+        raise HTTPException(status_code=400, detail="Pass either `after` or `before`, not both")
+    if before is not None and stream:
+        raise HTTPException(status_code=400, detail="`before` is not supported when streaming")
+
+    fields = SORT_FIELDS[sort]
+    backward = before is not None
+    position = decode_cursor(before if backward else after, sort)
+    if position is not None:
+        query = {**query, **keyset_filter(fields, position, "$lt" if backward else "$gt")}
+    # Walk the index backwards for `before` and flip the page afterwards
+    direction = -1 if backward else 1
+    order = [(field, direction) for field in fields] if limit or position is not None or sort != "_id" else None
+    if projection is not None and sort != "_id":
+        # The cursor needs the sort key of the boundary documents
+        projection = {**projection, sort: 1}
+
+    if stream:
+        documents = mongo.iter_documents(
+            DB_NAME, COLLECTION_NAME, query, sort=order, limit=limit or 0, projection=projection
+        )
+        return StreamingResponse(stream_ndjson(documents, projection is not None), media_type="application/x-ndjson")
+
+    # One extra document tells whether another page exists past this one
+    coordinates = await mongo.find_documents(
+        DB_NAME, COLLECTION_NAME, query, sort=order, limit=limit + 1 if limit else 0, projection=projection
+    )
+    has_more = bool(limit) and len(coordinates) > limit
+    if has_more:
+        del coordinates[limit:]
+
+    if backward:
+        coordinates.reverse()
+        if has_more:
+            response.headers[PREV_CURSOR_HEADER] = encode_cursor(coordinates[0], sort)
+        if coordinates:
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(coordinates[-1], sort)
+    else:
+        if has_more:
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(coordinates[-1], sort)
+        if position is not None and coordinates:
+            response.headers[PREV_CURSOR_HEADER] = encode_cursor(coordinates[0], sort)
+    return coordinates
+
+def cursor_headers(response: Response) -> dict:
+    """The pagination headers list_coordinates set, to replay on a rendered/cached response"""
+    return {name: response.headers[name] for name in (NEXT_CURSOR_HEADER, PREV_CURSOR_HEADER) if name in response.headers}
+
+# Response helpers
+def json_response(body: bytes, headers: Optional[dict] = None, status_code: int = 200) -> Response:
+    """Send pre-rendered JSON bytes, bypassing response_model re-validation"""
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
+
+def cached_response(entry: CachedResponse, status: str) -> Response:
+    return json_response(entry.body, {**entry.headers, "X-Cache": status})
+
+# In-memory index helpers
+def index_loader(mongo: AsyncMongoConnection, guild_id: str):
+    """Loader used by the guild indexes the first time a guild is queried"""
+    return lambda: mongo.find_documents(DB_NAME, COLLECTION_NAME, {"guild_id": guild_id}, projection=INDEX_PROJECTION)
+
+def indexes_upsert(document: dict):
+    for index in GUILD_INDEXES:
+        index.upsert(document)
+
+def indexes_remove(guild_id: str, document_id: str):
+    for index in GUILD_INDEXES:
+        index.remove(guild_id, document_id)
+
+def indexes_invalidate(guild_id: str):
+    for index in GUILD_INDEXES:
+        index.invalidate(guild_id)
 
 # ROUTE METHODS
 
-@coordinateRouter.get("/coordinates", response_model=List[MinecraftCoordinate])
-async def get_all_coordinates():
-    """ Retrieves all Minecraft coordinates stored in the database. """
+@coordinateRouter.get("/coordinates", response_model=List[Union[MinecraftCoordinate, CoordinateProjection]], response_model_exclude_unset=True)
+async def get_all_coordinates(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    stream: bool = False,
+    fields: Optional[str] = None,
+    mongo: AsyncMongoConnection = Depends(get_mongo_connection),
+):
+    """
+    Retrieves all Minecraft coordinates stored in the database.
+
+    Pass `limit` (and the `X-Next-Cursor` header value as `after`) to page through
+    results, or `stream=true` to receive NDJSON as the cursor produces documents.
+    `fields` (e.g. `fields=coordinateName,coordinates`) limits the returned fields.
+    """
+    projection = parse_fields(fields)
     try:
-        coordinates = MongoConnection.find_documents(DB_NAME, COLLECTION_NAME, {})
-        
-        if not coordinates:
+        coordinates = await list_coordinates(mongo, response, {}, limit, after, stream, projection)
+        if stream:
+            return coordinates
+
+        if not coordinates and after is None:
             raise HTTPException(status_code=404, detail="No coordinates found in the database.")
         
-        return [mongo_to_pydantic(coord) for coord in coordinates]
+        return json_response(dumps_documents(coordinates, projection is not None), cursor_headers(response))
     
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@coordinateRouter.get("/coordinates/{guild_id}", response_model=List[Union[MinecraftCoordinate, CoordinateProjection]], response_model_exclude_unset=True)
+async def get_coordinates_by_guild(
+    guild_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    sort: Literal["_id", "dimension"] = "_id",
+    stream: bool = False,
+    fields: Optional[str] = None,
+    mongo: AsyncMongoConnection = Depends(get_mongo_connection),
+):
+    """
+    Retrieves all Minecraft coordinates stored in the database for a specific guild.
+
+    Supports the same `limit`/`after` pagination, `stream` NDJSON mode and `fields`
+    projection as /coordinates. `sort=dimension` orders by dimension (then _id), and
+    `before` (the `X-Prev-Cursor` header value) pages backwards.
+    """
+    projection = parse_fields(fields)
+    cache_key = (guild_id, None, (limit, after, before, sort, fields))
+    if not stream:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached_response(cached, "HIT")
+    generation = response_cache.generation(guild_id)
+
+    try:
+        coordinates = await list_coordinates(
+            mongo, response, {"guild_id": guild_id}, limit, after, stream, projection, before=before, sort=sort
+        )
+        if stream:
+            return coordinates
+
+        # An empty guild renders as [] like before
+        entry = CachedResponse(dumps_documents(coordinates, projection is not None), cursor_headers(response))
+        response_cache.put(cache_key, entry, generation)
+        return cached_response(entry, "MISS")
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@coordinateRouter.get("/coordinates/{guild_id}", response_model=List[MinecraftCoordinate])
-async def get_coordinates_by_guild(guild_id: str):
-    """ Retrieves all Minecraft coordinates stored in the database for a specific guild. """
+@coordinateRouter.get("/coordinates/near/{guild_id}", response_model=List[NearbyCoordinate])
+async def get_nearby_coordinates(
+    guild_id: str,
+    response: Response,
+    x: int,
+    y: int,
+    z: int,
+    dimension: str,
+    k: Optional[int] = Query(None, ge=1, le=MAX_NEARBY_RESULTS),
+    radius: Optional[float] = Query(None, gt=0),
+    mongo: AsyncMongoConnection = Depends(get_mongo_connection),
+):
+    """
+    Retrieves the coordinates of a guild closest to a point in a dimension.
+
+    Returns the `k` nearest coordinates (default 5), or every coordinate within `radius`
+    blocks when only `radius` is given; both can be combined. Answered from the in-memory
+    spatial index, which is loaded on the guild's first query.
+    """
     try:
-        coordinates = MongoConnection.find_documents(DB_NAME, COLLECTION_NAME, {"guild_id": guild_id})
+        index = await spatial_index.get_guild(guild_id, index_loader(mongo, guild_id))
+
+        started = time.perf_counter()
+        grid = index.grid(dimension)
+        if grid is None:
+            matches = []
+        elif k is None and radius is not None:
+            matches = grid.within(x, y, z, radius)[:MAX_NEARBY_RESULTS]
+        else:
+            matches = grid.nearest(x, y, z, k or 5, radius)
+        response.headers["Server-Timing"] = f"index;dur={(time.perf_counter() - started) * 1000:.3f}"
+
+        return [
+            NearbyCoordinate(
+                _id=point.id,
+                coordinateName=point.coordinateName,
+                coordinates={"x": point.x, "y": point.y, "z": point.z},
+                dimension=point.dimension,
+                username=point.username,
+                distance=round(distance, 2),
+            )
+            for distance, point in matches
+        ]
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        if not coordinates:
-            return []  # Return an empty list
+@coordinateRouter.get("/coordinates/search/{guild_id}", response_model=List[CoordinateSearchHit])
+async def search_coordinate_names(
+    guild_id: str,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=MAX_SEARCH_RESULTS),
+    mongo: AsyncMongoConnection = Depends(get_mongo_connection),
+):
+    """
+    Searches a guild's coordinate names, case-insensitively.
 
-        return [mongo_to_pydantic(coord) for coord in coordinates]
+    Results are ranked exact > prefix > substring > typo-tolerant match and come from
+    the in-memory name index, so no regex scan runs against the collection.
+    """
+    try:
+        index = await name_index.get_guild(guild_id, index_loader(mongo, guild_id))
+        return [CoordinateSearchHit(**hit._asdict()) for hit in index.search(q, limit)]
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@coordinateRouter.get("/coordinates/{guild_id}/{coordinate_name}", response_model=List[MinecraftCoordinate])
-async def get_coordinate(guild_id: str, coordinate_name: str):
+@coordinateRouter.get("/coordinates/{guild_id}/{coordinate_name}", response_model=List[Union[MinecraftCoordinate, CoordinateProjection]], response_model_exclude_unset=True)
+async def get_coordinate(guild_id: str, coordinate_name: str, fields: Optional[str] = None,
+                         mongo: AsyncMongoConnection = Depends(get_mongo_connection)):
     """ Retrieves a Minecraft coordinate from the database by its name. """
+    projection = parse_fields(fields)
+    cache_key = (guild_id, coordinate_name, fields)
     try:
-        coordinates = MongoConnection.find_documents(
-            DB_NAME,
-            COLLECTION_NAME,
-            {"guild_id": guild_id, "coordinateName": coordinate_name}
-        )
+        cached = response_cache.get(cache_key)
+        if cached is None:
+            generation = response_cache.generation(guild_id)
+            coordinates = await mongo.find_documents(
+                DB_NAME,
+                COLLECTION_NAME,
+                {"guild_id": guild_id, "coordinateName": coordinate_name},
+                projection=projection
+            )
+            # Misses are cached too: they back the existence checks of the add/delete modals
+            cached = CachedResponse(dumps_documents(coordinates, projection is not None), {}, found=bool(coordinates))
+            response_cache.put(cache_key, cached, generation)
+            status = "MISS"
+        else:
+            status = "HIT"
 
-        if not coordinates:
+        if not cached.found:
             raise HTTPException(status_code=404, detail="Coordinate Name not found")
 
-        return [mongo_to_pydantic(coord) for coord in coordinates]
+        return cached_response(cached, status)
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Bulk write helpers
+async def read_bulk_items(request: Request):
+    """Yield raw bulk items from a JSON array body or, for application/x-ndjson, line by line"""
+    if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line
+        if buffer.strip():
+            yield buffer
+        return
+
+    try:
+        items = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of operations")
+    for item in items:
+        yield item
+
+def to_write_operation(guild_id: str, operation: BulkCoordinateOperation):
+    """Translate a validated bulk item into a pymongo write model"""
+    name_query = {"guild_id": guild_id, "coordinateName": operation.coordinateName}
+    if operation.op == "delete":
+        return DeleteOne(name_query)
+
+    operation.coordinate.guild_id = guild_id
+    document = operation.coordinate.model_dump(by_alias=True, exclude_none=True)
+    document.pop("id", None)
+    if operation.op == "insert":
+        return InsertOne(document)
+
+    # Upsert by name: keep the original _id and created_at when the coordinate already exists
+    on_insert = {"_id": document.pop("_id"), "created_at": document.pop("created_at")}
+    return UpdateOne(name_query, {"$set": document, "$setOnInsert": on_insert}, upsert=True)
+
+async def apply_bulk_batch(mongo: AsyncMongoConnection, guild_id: str, batch: list, response: BulkWriteResponse):
+    """Run one unordered bulk_write and record a result for every item of the batch"""
+    operations = [to_write_operation(guild_id, operation) for _, operation in batch]
+    outcome = await mongo.bulk_write(DB_NAME, COLLECTION_NAME, operations, ordered=False)
+
+    errors = {error["index"]: error.get("errmsg", "Write failed") for error in outcome.get("writeErrors", [])}
+    upserted = {item["index"]: str(item["_id"]) for item in outcome.get("upserted", [])}
+    response.inserted += outcome.get("nInserted", 0)
+    response.upserted += outcome.get("nUpserted", 0)
+    response.matched += outcome.get("nMatched", 0)
+    response.modified += outcome.get("nModified", 0)
+    response.deleted += outcome.get("nRemoved", 0)
+    response.failed += len(errors)
+
+    for position, (index, operation) in enumerate(batch):
+        result = BulkItemResult(index=index, op=operation.op, coordinateName=operation.coordinateName,
+                                ok=position not in errors, error=errors.get(position))
+        if result.ok and operation.op == "insert":
+            result.id = str(operation.coordinate.id)
+        elif operation.op == "upsert":
+            result.id = upserted.get(position)
+        response.results.append(result)
+
+@coordinateRouter.post("/coordinates/bulk/{guild_id}", response_model=BulkWriteResponse)
+async def bulk_write_coordinates(guild_id: str, request: Request,
+                                 mongo: AsyncMongoConnection = Depends(get_mongo_connection)):
+    """
+    Applies many coordinate writes for a guild with unordered bulk_write.
+
+    The body is a JSON array (or an application/x-ndjson stream) of operations:
+    `{"op": "insert" | "upsert", "coordinate": {...}}` or `{"op": "delete", "coordinateName": "..."}`.
+    Upserts match on coordinateName. Invalid items and failed writes are reported per item
+    without aborting the rest of the import.
+    """
+    response = BulkWriteResponse()
+    batch = []
+    index = 0
+    try:
+        async for item in read_bulk_items(request):
+            try:
+                raw = orjson.loads(item) if isinstance(item, bytes) else item
+                batch.append((index, BulkCoordinateOperation.model_validate(raw)))
+            except (ValidationError, orjson.JSONDecodeError) as e:
+                response.failed += 1
+                response.results.append(BulkItemResult(index=index, ok=False, error=str(e)))
+            index += 1
+
+            if len(batch) >= BULK_BATCH_SIZE:
+                await apply_bulk_batch(mongo, guild_id, batch, response)
+                batch = []
+
+        if batch:
+            await apply_bulk_batch(mongo, guild_id, batch, response)
+
+        response.results.sort(key=lambda result: result.index)
+        return response
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Any batch may have been applied, so the guild's indexes and cached reads are dropped
+        indexes_invalidate(guild_id)
+        response_cache.invalidate(guild_id)
+
+@coordinateRouter.post("/coordinates/{guild_id}/{coordinate_name}", response_model=MinecraftCoordinate,
+                       responses={409: {"description": "`if_absent=true` and the name is taken; the body lists the `matches`"}})
+async def add_coordinate(guild_id: str, coordinate_name: str, coordinate: MinecraftCoordinate, if_absent: bool = False, mongo: AsyncMongoConnection = Depends(get_mongo_connection)):
+    """
+    Adds a new Minecraft coordinate to the database.
 
-@coordinateRouter.post("/coordinates/{guild_id}/{coordinate_name}", response_model=MinecraftCoordinate)
-async def add_coordinate(guild_id: str, coordinate_name: str, coordinate: MinecraftCoordinate):
-    """ Adds a new Minecraft coordinate to the database. """
+    With `if_absent=true` the coordinate is only inserted when the guild has no
+    coordinate with this name yet; otherwise nothing is written and a 409 is
+    returned with the existing coordinates under `matches`.
+    """
     try:
         coordinate.guild_id = guild_id
         coordinate.coordinateName = coordinate_name
@@ -84,7 +468,16 @@ async def add_coordinate(guild_id: str, coordinate_name: str, coordinate: Minecr
          # Remove the duplicate id field if both exist
         if "id" in payload and "_id" in payload:
             del payload["id"]
-        MongoConnection.insert_document(DB_NAME, COLLECTION_NAME, payload)
+        if if_absent:
+            query = {"guild_id": guild_id, "coordinateName": coordinate_name}
+            if not await mongo.insert_document_if_absent(DB_NAME, COLLECTION_NAME, query, payload):
+                matches = await mongo.find_documents(DB_NAME, COLLECTION_NAME, query)
+                body = {"detail": "A coordinate with this name already exists", "matches": [shape_coordinate(match) for match in matches]}
+                return json_response(dumps_document(body), status_code=409)
+        else:
+            await mongo.insert_document(DB_NAME, COLLECTION_NAME, payload)
+        indexes_upsert(payload)
+        response_cache.invalidate(guild_id, coordinate_name)
         return coordinate
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=f"Validation error: {e}")
@@ -93,7 +486,7 @@ async def add_coordinate(guild_id: str, coordinate_name: str, coordinate: Minecr
 
 
 @coordinateRouter.put("/coordinates/{coordinate_id}", response_model=CoordinateUpdatePayload)
-async def overwrite_coordinate(guild_id: str, coordinate_id: str, coordinate: CoordinateUpdatePayload):
+async def overwrite_coordinate(guild_id: str, coordinate_id: str, coordinate: CoordinateUpdatePayload, mongo: AsyncMongoConnection = Depends(get_mongo_connection)):
     """ Updates an existing Minecraft coordinate in the database by object ID. """
     try:
         coordinate_id = ObjectId(coordinate_id)
@@ -101,7 +494,7 @@ async def overwrite_coordinate(guild_id: str, coordinate_id: str, coordinate: Co
         # Convert payload to dict and remove None values to avoid overwriting fields
         update_data = {k: v for k, v in coordinate.dict().items() if v is not None}
         
-        updated_count = MongoConnection.update_document(
+        updated_count = await mongo.update_document(
             DB_NAME, COLLECTION_NAME, {"_id": coordinate_id, "guild_id": guild_id}, update_data
         )
 
@@ -109,41 +502,53 @@ async def overwrite_coordinate(guild_id: str, coordinate_id: str, coordinate: Co
             raise HTTPException(status_code=404, detail="Coordinate not found")
 
         # Fetch the updated document to return
-        updated_coordinate = MongoConnection.get_document(
+        updated_coordinate = await mongo.get_document(
             DB_NAME, COLLECTION_NAME, {"_id": coordinate_id}
         )
         
         if not updated_coordinate:
             raise HTTPException(status_code=404, detail="Failed to retrieve updated coordinate")
-            
+
+        indexes_upsert(updated_coordinate)
+        response_cache.invalidate(guild_id)
+
         return CoordinateUpdatePayload(**updated_coordinate)
     
+    except HTTPException:
+        raise
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=f"Validation error: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @coordinateRouter.delete("/coordinates/{guild_id}/{coordinate_name}")
-async def delete_coordinate(guild_id: str, coordinate_name: str):
+async def delete_coordinate(guild_id: str, coordinate_name: str, mongo: AsyncMongoConnection = Depends(get_mongo_connection)):
     """ Deletes a Minecraft coordinate by its name. """
     try:
-        deleted_count = MongoConnection.delete_document(
+        deleted = await mongo.delete_and_return_document(
             DB_NAME, COLLECTION_NAME, {"guild_id": guild_id, "coordinateName": coordinate_name}
         )
 
-        if deleted_count == 0:
+        if deleted is None:
             raise HTTPException(status_code=404, detail="Coordinate not found")
 
+        indexes_remove(guild_id, str(deleted["_id"]))
+        response_cache.invalidate(guild_id, coordinate_name)
+
         return {"message": "Coordinate deleted successfully"}
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @coordinateRouter.delete("/coordinates/{guild_id}")
-async def clear_coordinates(guild_id: str):
+async def clear_coordinates(guild_id: str, mongo: AsyncMongoConnection = Depends(get_mongo_connection)):
     """ Deletes all Minecraft coordinates from the database for a specific guild. """
     try:
-        result = MongoConnection.clear_documents(DB_NAME, COLLECTION_NAME, {"guild_id": guild_id})
+        result = await mongo.clear_documents(DB_NAME, COLLECTION_NAME, {"guild_id": guild_id})
+        indexes_invalidate(guild_id)
+        response_cache.invalidate(guild_id)
 
         if result.deleted_count == 0:
             return {"message": "No coordinates found for this guild, nothing to delete"}
@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from services.responseCache import response_cache
+from services.answerCache import answer_cache
+from minecraft_assistant.bot_tools.toolCache import tool_cache
+from minecraft_assistant.chatbot import message_history
+
+metricsRouter = APIRouter()
+
+@metricsRouter.get("/metrics")
+async def get_metrics():
+    """ Returns in-process cache statistics, used to size the caches. """
+    return {
+        "coordinate_response_cache": response_cache.stats(),
+        "chatbot_answer_cache": answer_cache.stats(),
+        "chatbot_tool_cache": tool_cache.stats(),
+        "chatbot_sessions": message_history.stats(),
+    }
@@ -0,0 +1,155 @@
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from config.config import settings
+
+
+class CachedAnswer(NamedTuple):
+    """A past chatbot answer and the question it answered."""
+    question: str
+    answer: str
+    urls: List[str]
+
+
+def normalize_question(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+class SemanticAnswerCache:
+    """
+    Cache of chatbot answers looked up by question similarity.
+
+    Questions are stored as unit-length embeddings in one contiguous float32
+    matrix, so a lookup is a single matrix-vector product (cosine similarity)
+    over all live entries. An answer is reused when the best match reaches
+    `threshold`. Entries expire after `ttl` seconds and the least recently used
+    entry is evicted beyond `max_entries`. An identical (normalized) question is
+    answered without needing an embedding at all.
+    """
+
+    def __init__(self, threshold: float, ttl: float, max_entries: int):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None  # (capacity, dim), rows [0, _count) are live
+        self._expires_at = np.zeros(0)
+        self._last_used = np.zeros(0)
+        self._answers: List[CachedAnswer] = []
+        self._rows: Dict[str, int] = {}  # normalized question -> row
+        self._count = 0
+        self.hits = 0
+        self.exact_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _remove(self, row: int):
+        """Drop a row by moving the last live row into its place"""
+        last = self._count - 1
+        del self._rows[normalize_question(self._answers[row].question)]
+        if row != last:
+            self._vectors[row] = self._vectors[last]
+            self._expires_at[row] = self._expires_at[last]
+            self._last_used[row] = self._last_used[last]
+            self._answers[row] = self._answers[last]
+            self._rows[normalize_question(self._answers[row].question)] = row
+        self._answers.pop()
+        self._count = last
+
+    def _purge_expired(self, now: float):
+        expired = np.flatnonzero(self._expires_at[:self._count] < now)
+        # Highest rows first so the swaps never move a row that is still to be removed
+        for row in expired[::-1]:
+            self._remove(int(row))
+            self.expirations += 1
+
+    def lookup_exact(self, question: str) -> Optional[CachedAnswer]:
+        """The answer to this exact question (up to case and spacing), if cached"""
+        row = self._rows.get(normalize_question(question))
+        if row is None or self._expires_at[row] < time.monotonic():
+            return None
+        self._last_used[row] = time.monotonic()
+        self.hits += 1
+        self.exact_hits += 1
+        return self._answers[row]
+
+    def lookup(self, vector) -> Optional[CachedAnswer]:
+        """The answer to the most similar cached question, if it is similar enough"""
+        now = time.monotonic()
+        self._purge_expired(now)
+        if self._count == 0:
+            self.misses += 1
+            return None
+
+        query = np.asarray(vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+        similarities = self._vectors[:self._count] @ query
+        row = int(np.argmax(similarities))
+        if similarities[row] < self.threshold:
+            self.misses += 1
+            return None
+
+        self._last_used[row] = now
+        self.hits += 1
+        return self._answers[row]
+
+    def add(self, vector, question: str, answer: str, urls: List[str]):
+        key = normalize_question(question)
+        if key in self._rows:
+            self._remove(self._rows[key])
+        now = time.monotonic()
+        self._purge_expired(now)
+        while self._count >= self.max_entries:
+            self._remove(int(np.argmin(self._last_used[:self._count])))
+            self.evictions += 1
+
+        vector = np.asarray(vector, dtype=np.float32)
+        vector = vector / (np.linalg.norm(vector) or 1.0)
+        if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+            # First entry (or the embedding model changed): start a fresh matrix
+            self._vectors = np.empty((0, vector.shape[0]), dtype=np.float32)
+            self._expires_at = np.zeros(0)
+            self._last_used = np.zeros(0)
+            self._answers.clear()
+            self._rows.clear()
+            self._count = 0
+        if self._count == len(self._vectors):
+            # Grow geometrically, never past max_entries
+            capacity = min(max(16, 2 * self._count), self.max_entries)
+            self._vectors = np.resize(self._vectors, (capacity, vector.shape[0]))
+            self._expires_at = np.resize(self._expires_at, capacity)
+            self._last_used = np.resize(self._last_used, capacity)
+
+        row = self._count
+        self._vectors[row] = vector
+        self._expires_at[row] = now + self.ttl
+        self._last_used[row] = now
+        self._answers.append(CachedAnswer(question, answer, list(urls)))
+        self._rows[key] = row
+        self._count += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._count,
+            "max_entries": self.max_entries,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "exact_hits": self.exact_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+answer_cache = SemanticAnswerCache(
+    threshold=settings.answer_cache_threshold,
+    ttl=settings.answer_cache_ttl_seconds,
+    max_entries=settings.answer_cache_max_entries,
+)
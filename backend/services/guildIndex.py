@@ -0,0 +1,98 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class GuildIndexRegistry(ABC):
+    """
+    Lazily built, incrementally maintained in-memory indexes, one per guild.
+
+    A guild is loaded from Mongo on its first query and then kept up to date by
+    the coordinate write routes (upsert/remove/invalidate). At most max_guilds
+    guilds are kept in memory; the least recently queried ones are dropped and
+    reloaded on demand. Subclasses provide new_guild_index(); the per-guild
+    object must implement add_document(document) and remove(document_id).
+
+    The write routes only reach the registry of their own process, so with several
+    API workers a guild loaded here can miss writes made elsewhere: a loaded guild
+    is rebuilt from Mongo once it is older than max_age seconds.
+    """
+
+    def __init__(self, max_guilds: int = 1000, max_age: Optional[float] = None):
+        self.max_guilds = max_guilds
+        self.max_age = max_age
+        self._guilds: "OrderedDict[str, object]" = OrderedDict()
+        self._loaded_at: Dict[str, float] = {}
+        # One lock per guild, kept for good: popping it while coroutines wait on it let a
+        # new caller load alongside them (one small object per guild ever queried)
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._building: Dict[str, bool] = {}  # guild_id -> written to while loading (one load at a time)
+
+    @abstractmethod
+    def new_guild_index(self):
+        """An empty index for one guild"""
+
+    async def get_guild(self, guild_id: str, loader: Callable[[], Awaitable[List[dict]]]):
+        """Return the guild's index, loading it with loader() on first use"""
+        index = self._guilds.get(guild_id)
+        if index is not None and self._expired(guild_id):
+            self._drop(guild_id)
+            index = None
+        if index is not None:
+            self._guilds.move_to_end(guild_id)
+            return index
+
+        lock = self._locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            index = self._guilds.get(guild_id)
+            if index is not None:
+                return index
+
+            self._building[guild_id] = False
+            try:
+                index = self.new_guild_index()
+                for document in await loader():
+                    index.add_document(document)
+            finally:
+                written_during_load = self._building.pop(guild_id)
+
+            # A write raced the load, so the snapshot may be stale: serve it once, rebuild next time
+            if not written_during_load:
+                self._guilds[guild_id] = index
+                self._loaded_at[guild_id] = time.monotonic()
+                while len(self._guilds) > self.max_guilds:
+                    self._drop(next(iter(self._guilds)))
+            return index
+
+    def _expired(self, guild_id: str) -> bool:
+        return self.max_age is not None and time.monotonic() - self._loaded_at[guild_id] > self.max_age
+
+    def _drop(self, guild_id: str):
+        self._guilds.pop(guild_id, None)
+        self._loaded_at.pop(guild_id, None)
+
+    def _mark_written(self, guild_id: str):
+        if guild_id in self._building:
+            self._building[guild_id] = True
+
+    def upsert(self, document: dict):
+        """Add or update a coordinate after it was written to Mongo"""
+        guild_id = document.get("guild_id")
+        self._mark_written(guild_id)
+        index = self._guilds.get(guild_id)
+        if index is not None:
+            index.add_document(document)
+
+    def remove(self, guild_id: str, document_id: str):
+        """Drop a coordinate after it was deleted from Mongo"""
+        self._mark_written(guild_id)
+        index = self._guilds.get(guild_id)
+        if index is not None:
+            index.remove(document_id)
+
+    def invalidate(self, guild_id: str):
+        """Forget a guild entirely (e.g. after clear or bulk writes); it is reloaded on next use"""
+        self._mark_written(guild_id)
+        self._drop(guild_id)
@@ -0,0 +1,162 @@
+import bisect
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Set
+from services.guildIndex import GuildIndexRegistry
+from config.config import settings
+
+# Candidates examined per match type, so a one-letter query stays cheap in huge guilds
+MAX_CANDIDATES = 200
+
+
+class NameMatch(NamedTuple):
+    """A ranked coordinate name returned by GuildNameIndex.search."""
+    score: float
+    match: str  # exact | prefix | substring | fuzzy
+    coordinateName: str
+    count: int  # number of coordinates saved under this name
+
+
+def normalize_name(name: str) -> str:
+    """Case-insensitive, whitespace-collapsed form used as the index key"""
+    return " ".join(name.casefold().split())
+
+
+def trigrams(text: str, padded: bool = True) -> Set[str]:
+    """Character trigrams; padding lets short names and word boundaries take part"""
+    if padded:
+        text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Edit distance between a and b, or None as soon as it must exceed max_distance"""
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > max_distance:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= max_distance else None
+
+
+def max_typos(length: int) -> int:
+    return 1 if length <= 4 else 2 if length <= 8 else 3
+
+
+class GuildNameIndex:
+    """Sorted array (prefix) plus trigram postings (substring, typos) over one guild's names."""
+
+    def __init__(self):
+        self.sorted_names: List[str] = []
+        self.postings: Dict[str, Set[str]] = {}
+        self.spellings: Dict[str, Counter] = {}  # normalized name -> original spellings
+        self.documents: Dict[str, str] = {}  # document id -> original name
+
+    def add_document(self, document: dict):
+        document_id = str(document.get("_id"))
+        self.remove(document_id)  # handles renames
+        name = document.get("coordinateName")
+        if not name:
+            return
+
+        self.documents[document_id] = name
+        key = normalize_name(name)
+        spellings = self.spellings.get(key)
+        if spellings is None:
+            spellings = self.spellings[key] = Counter()
+            bisect.insort(self.sorted_names, key)
+            for gram in trigrams(key):
+                self.postings.setdefault(gram, set()).add(key)
+        spellings[name] += 1
+
+    def remove(self, document_id: str):
+        name = self.documents.pop(document_id, None)
+        if name is None:
+            return
+
+        key = normalize_name(name)
+        spellings = self.spellings[key]
+        spellings[name] -= 1
+        if spellings[name] <= 0:
+            del spellings[name]
+        if spellings:
+            return
+
+        del self.spellings[key]
+        del self.sorted_names[bisect.bisect_left(self.sorted_names, key)]
+        for gram in trigrams(key):
+            names = self.postings[gram]
+            names.discard(key)
+            if not names:
+                del self.postings[gram]
+
+    def search(self, query: str, limit: int = 10) -> List[NameMatch]:
+        """Rank names by exact > prefix > substring > typo-tolerant match"""
+        q = normalize_name(query)
+        if not q:
+            return []
+
+        found: Dict[str, tuple] = {}
+        if q in self.spellings:
+            found[q] = (1.0, "exact")
+
+        # Prefix: contiguous run in the sorted array
+        start = bisect.bisect_left(self.sorted_names, q)
+        for key in self.sorted_names[start:start + MAX_CANDIDATES]:
+            if not key.startswith(q):
+                break
+            found.setdefault(key, (0.8 + 0.1 * len(q) / len(key), "prefix"))
+
+        # Substring: names holding every trigram of the query, then verified
+        if len(q) >= 3:
+            grams = sorted((self.postings.get(gram, set()) for gram in trigrams(q, padded=False)), key=len)
+            candidates = set.intersection(*grams) if grams else set()
+            for key in list(candidates)[:MAX_CANDIDATES]:
+                if q in key:
+                    found.setdefault(key, (0.6 + 0.1 * len(q) / len(key), "substring"))
+
+        # Typos: names sharing the most trigrams, confirmed with a bounded edit distance
+        overlap = Counter()
+        for gram in trigrams(q):
+            for key in self.postings.get(gram, ()):
+                if key not in found:
+                    overlap[key] += 1
+        budget = max_typos(len(q))
+        for key, _ in overlap.most_common(MAX_CANDIDATES):
+            distance = bounded_levenshtein(q, key, budget)
+            # Also accept a typo inside a name the user has only partly typed
+            partial = bounded_levenshtein(q, key[:len(q)], budget) if len(key) > len(q) else None
+            if distance is not None:
+                found[key] = (0.5 * (1 - distance / max(len(q), len(key))), "fuzzy")
+            elif partial is not None:
+                found[key] = (0.45 * (1 - partial / len(q)), "fuzzy")
+
+        ranked = sorted(found.items(), key=lambda item: (-item[1][0], item[0]))[:limit]
+        return [
+            NameMatch(
+                score=round(score, 3),
+                match=match,
+                coordinateName=self.spellings[key].most_common(1)[0][0],
+                count=sum(self.spellings[key].values()),
+            )
+            for key, (score, match) in ranked
+        ]
+
+
+class NameSearchIndex(GuildIndexRegistry):
+    """Per-guild coordinate name indexes for prefix, substring and fuzzy search."""
+
+    def new_guild_index(self) -> GuildNameIndex:
+        return GuildNameIndex()
+
+
+# Process-wide instance shared by the coordinate routes
+name_index = NameSearchIndex(max_age=settings.guild_index_max_age_seconds)
@@ -0,0 +1,124 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, NamedTuple, Optional, Set, Tuple
+from config.config import settings
+
+# Entry bookkeeping (key tuple, dict slots, ...) charged on top of the body size
+ENTRY_OVERHEAD_BYTES = 256
+
+
+class CachedResponse(NamedTuple):
+    """Rendered response body (JSON bytes) and the headers sent with it."""
+    body: bytes
+    headers: Dict[str, str]
+    found: bool = True  # False caches a "Coordinate Name not found" lookup
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers.items()) + ENTRY_OVERHEAD_BYTES
+
+
+CacheKey = Tuple[str, Optional[str], Hashable]  # (guild_id, coordinate name or None for lists, query params)
+
+
+class ResponseCache:
+    """
+    LRU cache of rendered coordinate reads, keyed by guild (and name for single lookups).
+
+    Bounded by both entry count and total bytes. The write routes invalidate the
+    affected guild's entries, so cached reads are never stale within this process.
+    Invalidation does not reach other processes: with several API workers a write
+    handled elsewhere is only seen here once the entry is `ttl` seconds old.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int, ttl: Optional[float] = None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._expires_at: Dict[CacheKey, float] = {}
+        self._guild_keys: Dict[str, Set[CacheKey]] = {}
+        self._generations: Dict[str, int] = {}  # bumped on every write to the guild
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None and key in self._expires_at and self._expires_at[key] < time.monotonic():
+            self._discard(key)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def generation(self, guild_id: str) -> int:
+        """Snapshot taken before a read; pass it to put() so a read racing a write is not cached"""
+        return self._generations.get(guild_id, 0)
+
+    def put(self, key: CacheKey, entry: CachedResponse, generation: int):
+        if entry.size > self.max_bytes or generation != self.generation(key[0]):
+            return
+        self._discard(key)
+        self._entries[key] = entry
+        if self.ttl is not None:
+            self._expires_at[key] = time.monotonic() + self.ttl
+        self._guild_keys.setdefault(key[0], set()).add(key)
+        self.bytes += entry.size
+        while self.bytes > self.max_bytes or len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def _discard(self, key: CacheKey):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._expires_at.pop(key, None)
+        self.bytes -= entry.size
+        keys = self._guild_keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._guild_keys[key[0]]
+
+    def invalidate(self, guild_id: str, coordinate_name: Optional[str] = None):
+        """
+        Drop cached reads made stale by a write.
+
+        With a name, only the guild's list pages and that name's lookups go; without
+        one (overwrite by id, clear, bulk) every entry of the guild is dropped.
+        """
+        self.invalidations += 1
+        self._generations[guild_id] = self.generation(guild_id) + 1
+        for key in list(self._guild_keys.get(guild_id, ())):
+            if coordinate_name is None or key[1] is None or key[1] == coordinate_name:
+                self._discard(key)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+# Process-wide cache shared by the coordinate routes
+response_cache = ResponseCache(
+    settings.response_cache_max_bytes, settings.response_cache_max_entries, settings.response_cache_ttl_seconds
+)
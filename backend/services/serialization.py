@@ -0,0 +1,51 @@
+from typing import Iterable
+from bson import ObjectId
+import orjson
+from models.coordinates import MinecraftCoordinate
+
+# Response keys in the order of the model, and the optional ones sent as null when not stored
+COORDINATE_FIELDS = tuple(field.alias or name for name, field in MinecraftCoordinate.model_fields.items())
+NULLABLE_FIELDS = frozenset(
+    field.alias or name for name, field in MinecraftCoordinate.model_fields.items()
+    if not field.is_required() and field.default is None
+)
+
+
+def _default(value):
+    """orjson fallback for the BSON types found in coordinate documents"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def shape_coordinate(document: dict, projected: bool = False) -> dict:
+    """
+    The coordinate as the response model used to render it: model fields only, in
+    model order, with unset optional fields (e.g. avatar_url) as null. A projected
+    read keeps just the fields it selected.
+    """
+    if projected:
+        return {key: document[key] for key in COORDINATE_FIELDS if key in document}
+    return {key: document.get(key) for key in COORDINATE_FIELDS if key in document or key in NULLABLE_FIELDS}
+
+
+def dumps_document(document: dict) -> bytes:
+    """Serialize one trusted Mongo document straight to JSON bytes"""
+    return orjson.dumps(document, default=_default)
+
+
+def dumps_documents(documents: Iterable[dict], projected: bool = False) -> bytes:
+    """
+    Serialize trusted coordinate documents to a JSON array (shaped by shape_coordinate).
+
+    Documents read back from our own collection were validated when they were
+    written, so the read path skips Pydantic entirely (no ObjectId round trip
+    through PyObjectId, no response_model re-validation) and lets orjson encode
+    datetimes and nested dicts natively.
+    """
+    return orjson.dumps([shape_coordinate(document, projected) for document in documents], default=_default)
+
+
+def dumps_ndjson_line(document: dict) -> bytes:
+    """One NDJSON line for streamed reads"""
+    return orjson.dumps(document, default=_default, option=orjson.OPT_APPEND_NEWLINE)
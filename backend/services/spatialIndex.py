@@ -0,0 +1,199 @@
+import heapq
+import math
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from services.guildIndex import GuildIndexRegistry
+from config.config import settings
+
+
+class SpatialPoint(NamedTuple):
+    """Minimal copy of a coordinate document kept in the spatial index."""
+    id: str
+    coordinateName: str
+    x: int
+    y: int
+    z: int
+    dimension: str
+    username: Optional[str]
+
+
+def _dimension_key(dimension: Optional[str]) -> str:
+    return (dimension or "").strip().lower()
+
+
+def point_from_document(document: dict) -> Optional[SpatialPoint]:
+    """Build a SpatialPoint from a Mongo document (None if it has no usable coordinates)"""
+    coords = document.get("coordinates") or {}
+    try:
+        return SpatialPoint(
+            id=str(document["_id"]),
+            coordinateName=document.get("coordinateName", ""),
+            x=int(coords["x"]),
+            y=int(coords["y"]),
+            z=int(coords["z"]),
+            dimension=document.get("dimension", ""),
+            username=document.get("username"),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class DimensionGrid:
+    """
+    Chunk-grid buckets for the points of one guild dimension.
+
+    Points are bucketed on (x, z) into square cells; y is only used for the
+    distance itself since Minecraft worlds are shallow compared to their width.
+    """
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Dict[str, SpatialPoint]] = {}
+        self.points: Dict[str, SpatialPoint] = {}
+        # Bounding box of occupied cells (only grows, which keeps it a safe over-estimate)
+        self.bounds: Optional[Tuple[int, int, int, int]] = None
+
+    def _cell(self, x: int, z: int) -> Tuple[int, int]:
+        return (x // self.cell_size, z // self.cell_size)
+
+    def add(self, point: SpatialPoint):
+        self.remove(point.id)
+        self.points[point.id] = point
+        cx, cz = self._cell(point.x, point.z)
+        self.cells.setdefault((cx, cz), {})[point.id] = point
+        if self.bounds is None:
+            self.bounds = (cx, cx, cz, cz)
+        else:
+            min_x, max_x, min_z, max_z = self.bounds
+            self.bounds = (min(min_x, cx), max(max_x, cx), min(min_z, cz), max(max_z, cz))
+
+    def remove(self, point_id: str) -> bool:
+        point = self.points.pop(point_id, None)
+        if point is None:
+            return False
+        cell = self._cell(point.x, point.z)
+        bucket = self.cells[cell]
+        del bucket[point_id]
+        if not bucket:
+            del self.cells[cell]
+        return True
+
+    def _ring(self, cx: int, cz: int, r: int) -> Iterable[Tuple[int, int]]:
+        """Cells at Chebyshev distance exactly r from (cx, cz)"""
+        if r == 0:
+            yield (cx, cz)
+            return
+        for dx in range(-r, r + 1):
+            yield (cx + dx, cz - r)
+            yield (cx + dx, cz + r)
+        for dz in range(-r + 1, r):
+            yield (cx - r, cz + dz)
+            yield (cx + r, cz + dz)
+
+    def nearest(self, x: int, y: int, z: int, k: int, radius: Optional[float] = None) -> List[Tuple[float, SpatialPoint]]:
+        """The k nearest points (optionally no further than radius), closest first"""
+        if not self.points or k <= 0:
+            return []
+
+        cx, cz = self._cell(x, z)
+        # Rings needed to cover every occupied cell; beyond that nothing is left to find
+        min_x, max_x, min_z, max_z = self.bounds
+        max_ring = max(cx - min_x, max_x - cx, cz - min_z, max_z - cz, 0)
+        if radius is not None:
+            max_ring = min(max_ring, int(radius // self.cell_size) + 1)
+
+        best: List[Tuple[float, str, SpatialPoint]] = []  # max-heap on distance via negation
+        for r in range(max_ring + 1):
+            # A full ring sweep costs more than scanning the occupied cells once
+            if (2 * r + 1) ** 2 > 4 * len(self.cells):
+                self._collect(best, k, x, y, z, radius,
+                              (bucket for cell, bucket in self.cells.items()
+                               if max(abs(cell[0] - cx), abs(cell[1] - cz)) >= r))
+                break
+            self._collect(best, k, x, y, z, radius,
+                          (self.cells[cell] for cell in self._ring(cx, cz, r) if cell in self.cells))
+            # Every point in ring r + 1 is at least r cells away horizontally
+            if len(best) == k and -best[0][0] <= r * self.cell_size:
+                break
+
+        return sorted(((-d, point) for d, _, point in best), key=lambda item: item[0])
+
+    @staticmethod
+    def _collect(best, k, x, y, z, radius, buckets):
+        for bucket in buckets:
+            for point in bucket.values():
+                distance = math.dist((x, y, z), (point.x, point.y, point.z))
+                if radius is not None and distance > radius:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, point.id, point))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, point.id, point))
+
+    def within(self, x: int, y: int, z: int, radius: float) -> List[Tuple[float, SpatialPoint]]:
+        """Every point no further than radius, closest first"""
+        cx, cz = self._cell(x, z)
+        span = int(radius // self.cell_size) + 1
+        if (2 * span + 1) ** 2 > len(self.cells):
+            buckets = self.cells.values()
+        else:
+            buckets = (self.cells[(cx + dx, cz + dz)]
+                       for dx in range(-span, span + 1)
+                       for dz in range(-span, span + 1)
+                       if (cx + dx, cz + dz) in self.cells)
+
+        found = []
+        for bucket in buckets:
+            for point in bucket.values():
+                distance = math.dist((x, y, z), (point.x, point.y, point.z))
+                if distance <= radius:
+                    found.append((distance, point))
+        found.sort(key=lambda item: item[0])
+        return found
+
+
+class GuildSpatialIndex:
+    """Per-dimension grids for a single guild."""
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.dimensions: Dict[str, DimensionGrid] = {}
+        self.point_dimensions: Dict[str, str] = {}
+
+    def add(self, point: SpatialPoint):
+        self.remove(point.id)
+        key = _dimension_key(point.dimension)
+        grid = self.dimensions.get(key)
+        if grid is None:
+            grid = self.dimensions[key] = DimensionGrid(self.cell_size)
+        grid.add(point)
+        self.point_dimensions[point.id] = key
+
+    def add_document(self, document: dict):
+        point = point_from_document(document)
+        if point is None:
+            self.remove(str(document.get("_id")))
+        else:
+            self.add(point)
+
+    def remove(self, point_id: str):
+        key = self.point_dimensions.pop(point_id, None)
+        if key is not None:
+            self.dimensions[key].remove(point_id)
+
+    def grid(self, dimension: str) -> Optional[DimensionGrid]:
+        return self.dimensions.get(_dimension_key(dimension))
+
+
+class SpatialIndex(GuildIndexRegistry):
+    """Per-guild spatial indexes answering nearest-neighbour and radius queries."""
+
+    def __init__(self, cell_size: int = 64, max_guilds: int = 1000, max_age: Optional[float] = None):
+        super().__init__(max_guilds, max_age)
+        self.cell_size = cell_size
+
+    def new_guild_index(self) -> GuildSpatialIndex:
+        return GuildSpatialIndex(self.cell_size)
+
+
+# Process-wide instance shared by the coordinate routes
+spatial_index = SpatialIndex(max_age=settings.guild_index_max_age_seconds)
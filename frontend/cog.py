@@ -1,8 +1,8 @@
-import asyncio
 import discord
 
 from dotenv import load_dotenv
 import os
+from typing import Optional
 from discord.ext import commands
 from discord import app_commands
 
@@ -11,7 +11,7 @@ from modals.delCoordModal import DelCoordModal
 from modals.findCoordModal import FindCoordModal
 from modals.updateCoordModal import UpdateCoordModal
 from modals.askKamiModal import AskKamiModal
-import httpx
+from views.coordinatePageView import coordinate_page
 
 # Define the Minecraft Assistant Cog
 class MinecraftAssistantCog(commands.Cog):
@@ -95,12 +95,13 @@ class MinecraftAssistantCog(commands.Cog):
             await interaction.response.send_message(f"An error occurred: {str(e)}", ephemeral=True)
     
     @app_commands.command(name="deletecoord", description="Remove a Minecraft coordinate using a modal")
-    async def del_coord(self, interaction: discord.Interaction):
+    @app_commands.describe(name="Name of the coordinate to remove")
+    async def del_coord(self, interaction: discord.Interaction, name: Optional[str] = None):
         """
         Remove a Minecraft coordinate using a modal
         """
         try:
-            await interaction.response.send_modal(DelCoordModal())
+            await interaction.response.send_modal(DelCoordModal(name))
         except Exception as e:
             await interaction.response.send_message(f"An error occurred: {str(e)}", ephemeral=True)
     
@@ -112,11 +113,12 @@ class MinecraftAssistantCog(commands.Cog):
         await interaction.response.defer()  # Defer response to prevent timeout
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(f"{self.API_URL}/coordinates/{interaction.guild.id}")
+            client = self.bot.api_client
+            response = await client.delete(f"{self.API_URL}/coordinates/{interaction.guild.id}")
 
             # Check Response from FastAPI
             if response.status_code == 200:
+                self.bot.coordinate_cache.record_cleared(interaction.guild.id)
                 response_embed = discord.Embed(
                     title="🗑️ Coordinates Cleared",
                     description="All Minecraft coordinates for this server have been successfully deleted.",
@@ -152,84 +154,23 @@ class MinecraftAssistantCog(commands.Cog):
         await interaction.response.defer()  # Prevent timeout while fetching data
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.API_URL}/coordinates/{interaction.guild.id}")
+            # Pages are fetched from the API (sorted by dimension) one at a time; the
+            # buttons carry their cursor so paging needs no per-listing state
+            embed, view = await coordinate_page(self.bot, interaction.guild.id)
 
-            if response.status_code == 200:
-                coordinates = response.json()
-
-                if not coordinates:
-                    response_embed = discord.Embed(
-                        title="❌ No Coordinates Saved",
-                        description="There are no saved coordinates for this server.",
-                        color=discord.Color.red()
-                    )
-                    await interaction.followup.send(embed=response_embed)
-                    return
-
-                # Sort by dimension
-                coordinates.sort(key=lambda c: c.get("dimension", ""))
-
-                # Pagination setup
-                MAX_COORDS_PER_PAGE=5
-                total_pages = (len(coordinates) // MAX_COORDS_PER_PAGE) + (1 if len(coordinates) % MAX_COORDS_PER_PAGE > 0 else 0)
-                current_page = 0
-
-                async def generate_embed(page: int):
-                    """Creates an embed for the given page index."""
-                    start = page * MAX_COORDS_PER_PAGE
-                    end = start + MAX_COORDS_PER_PAGE
-                    coords_page = coordinates[start:end]
-
-                    embed = discord.Embed(
-                        title=f"Saved Coordinates (Page {page+1}/{total_pages})",
-                        color=discord.Color.green()
-                    )
-
-                    for coord in coords_page:
-                        name = coord.get("coordinateName", "Unknown Name")
-                        coords = coord.get("coordinates", "Unknown Coordinates")
-                        dimension = coord.get("dimension", "Unknown Dimension")
-                        username = coord.get("username", "Unknown User")
-                        
-                        #format the coords
-                        coords = f"{coords.get('x', 'Unknown')},{coords.get('y', 'Unknown')},{coords.get('z', 'Unknown')}"
-                        embed.add_field(
-                            name=f"📌**{name}**",
-                            value=f"**Coordinates: **{coords}\n**Dimension:** {dimension}\n**Saved by: {username}**" ,
-                            inline=False
-                        )
-
-                    return embed
-
-                # Send first page
-                message = await interaction.followup.send(embed=await generate_embed(current_page))
-
-                # If only one page, no need for reactions
-                if total_pages == 1:
-                    return
-
-                # Add pagination reactions
-                await message.add_reaction("⬅️")
-                await message.add_reaction("➡️")
-
-                def check(reaction, user):
-                    return user == interaction.user and reaction.message.id == message.id and str(reaction.emoji) in ["⬅️", "➡️"]
-                #listen for reactions
-                while True:
-                    try:
-                        reaction, user = await self.bot.wait_for("reaction_add", timeout=60.0, check=check)
-
-                        if str(reaction.emoji) == "➡️" and current_page < total_pages - 1:
-                            current_page += 1
-                        elif str(reaction.emoji) == "⬅️" and current_page > 0:
-                            current_page -= 1
-
-                        await message.edit(embed=await generate_embed(current_page))
-                        await message.remove_reaction(reaction, user)
+            if embed is None:
+                response_embed = discord.Embed(
+                    title="❌ No Coordinates Saved",
+                    description="There are no saved coordinates for this server.",
+                    color=discord.Color.red()
+                )
+                await interaction.followup.send(embed=response_embed)
+                return
 
-                    except asyncio.TimeoutError:
-                        break  # Exit loop if user is inactive
+            if view is None:
+                await interaction.followup.send(embed=embed)
+            else:
+                await interaction.followup.send(embed=embed, view=view)
 
         except Exception as e:
             print(f"❌ Error fetching coordinates: {str(e)}")  # Debugging log
@@ -241,22 +182,34 @@ class MinecraftAssistantCog(commands.Cog):
             await interaction.followup.send(embed=response_embed)
 
     @app_commands.command(name="findcoord", description="List all the coordinates with a specific name") 
-    async def find_coords(self, interaction: discord.Interaction):
+    @app_commands.describe(name="Name of the coordinate to find")
+    async def find_coords(self, interaction: discord.Interaction, name: Optional[str] = None):
         """Look for a saved coordinates using a modal"""
         try:
-            await interaction.response.send_modal(FindCoordModal())
+            await interaction.response.send_modal(FindCoordModal(name))
         except Exception as e:
             await interaction.response.send_message(f"An error occurred: {str(e)}", ephemeral=True)
             
     @app_commands.command(name="updatecoord", description="Update a Minecraft coordinate using a modal")
-    async def update_coord(self, interaction: discord.Interaction):
+    @app_commands.describe(name="Name of the coordinate to update")
+    async def update_coord(self, interaction: discord.Interaction, name: Optional[str] = None):
         """
         Update a Minecraft coordinate using a modal
         """
         try:
-            await interaction.response.send_modal(UpdateCoordModal())
+            await interaction.response.send_modal(UpdateCoordModal(name))
         except Exception as e:
             await interaction.response.send_message(f"An error occurred: {str(e)}", ephemeral=True)
+
+    @del_coord.autocomplete("name")
+    @find_coords.autocomplete("name")
+    @update_coord.autocomplete("name")
+    async def coordinate_name_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Autocomplete for coordinate name arguments, served from the bot's in-memory prefix index"""
+        names = await self.bot.coordinate_cache.names.suggest(
+            self.bot.api_client, self.API_URL, interaction.guild_id, current
+        )
+        return [app_commands.Choice(name=name, value=name) for name in names]
         
     @app_commands.command(name="askkami", description="Ask a Minecraft-related question")
     async def ask_kami(self, interaction: discord.Interaction):  
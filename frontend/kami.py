@@ -1,3 +1,4 @@
+import argparse
 import os
 import sys
 import discord
@@ -8,6 +9,11 @@ import asyncio
 # Add the root directory to sys.path
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
+from utils.apiClient import create_api_client
+from utils.coordinateCache import CoordinateCache
+from utils.commandSync import sync_if_changed
+from views.coordinatePageView import CoordinatePageButton, DisabledPageButton
+
 # Load environment variables
 load_dotenv()
 DiscordToken = os.getenv("discordbotToken")
@@ -16,24 +22,49 @@ if DiscordToken is None:
 
 DiscordToken = DiscordToken.strip()
 
+# Gateway/cache profile (see build_intents below)
+INTENTS_PROFILE = os.getenv("DISCORD_INTENTS", "minimal").lower()
+MAX_MESSAGES = int(os.getenv("DISCORD_MAX_MESSAGES", "0")) or None  # 0 disables the message cache
+AUTO_SHARD = os.getenv("DISCORD_AUTO_SHARD", "false").lower() == "true"
+SHARD_COUNT = int(os.getenv("DISCORD_SHARD_COUNT", "0")) or None  # None lets Discord recommend one
+
+# Large deployments shard automatically (one process, several gateway connections)
+BotBase = commands.AutoShardedBot if AUTO_SHARD else commands.Bot
+
 # Bot Class
-class Kami(commands.Bot):
-    def __init__(self, command_prefix, intents):
-        super().__init__(command_prefix=command_prefix, intents=intents, help_command=None)  # Disable the default help command
+class Kami(BotBase):
+    def __init__(self, command_prefix, intents, **options):
+        super().__init__(command_prefix=command_prefix, intents=intents, help_command=None, **options)  # Disable the default help command
+        self.api_client = None  # Shared, pooled client for the Kami API (see setup_hook)
+        self.coordinate_cache = CoordinateCache()  # Per-guild coordinates, kept fresh by the bot's own writes
+        self.force_sync = False  # Set by --force-sync
 
-    async def on_ready(self):
-        print(f"Bot is ready! Logged in as {self.user}")
+    async def setup_hook(self):
+        self.api_client = create_api_client()
+        # /listcoords paging buttons are stateless, route them by custom_id (survives restarts)
+        self.add_dynamic_items(CoordinatePageButton, DisabledPageButton)
 
-        # Sync application commands
+        # Sync application commands once per process (not on every on_ready/reconnect),
+        # and only when the command tree changed since the last sync
         try:
-            await self.tree.sync()
-            print("Slash commands synced successfully!")
+            if await sync_if_changed(self.tree, self.application_id, force=self.force_sync):
+                print("Slash commands synced successfully!")
+            else:
+                print("Slash commands unchanged, skipping sync")
         except Exception as e:
             print(f"Failed to sync slash commands: {e}")
 
+    async def on_ready(self):
+        print(f"Bot is ready! Logged in as {self.user}")
+
     async def on_disconnect(self):
         print("Bot is disconnecting...")
 
+    async def close(self):
+        if self.api_client is not None:
+            await self.api_client.aclose()
+        await super().close()
+
     async def load_cogs(self):
         """Load all cogs asynchronously."""
         COG_DIRECTORY = os.path.dirname(__file__)  # Same directory as kami.py
@@ -47,14 +78,41 @@ class Kami(commands.Bot):
                     print(f"Failed to load cog {cog_name}: {e}")
 
 # Bot Intents
-intents = discord.Intents.all()
-intents.message_content = True
+def build_intents(profile: str) -> discord.Intents:
+    """
+    Gateway intents for a profile.
+
+    "minimal" subscribes only to what Kami uses: guilds (interaction.guild), guild and
+    DM messages with message content (the `-help`/`-commands` prefix commands).
+    Interactions need no intent. "all" restores the previous everything-on behaviour.
+    """
+    if profile == "all":
+        return discord.Intents.all()
+    if profile != "minimal":
+        raise ValueError(f"Unknown DISCORD_INTENTS profile: {profile!r} (expected 'minimal' or 'all')")
+    intents = discord.Intents.none()
+    intents.guilds = True
+    intents.guild_messages = True
+    intents.dm_messages = True
+    intents.message_content = True
+    return intents
+
+intents = build_intents(INTENTS_PROFILE)
 
 # Initialize Bot
-client = Kami(command_prefix="-", intents=intents)
+client = Kami(
+    command_prefix="-",
+    intents=intents,
+    # Cache members only as far as the intents require (none for the minimal profile)
+    member_cache_flags=discord.MemberCacheFlags.from_intents(intents),
+    chunk_guilds_at_startup=intents.members,
+    max_messages=MAX_MESSAGES,
+    **({"shard_count": SHARD_COUNT} if AUTO_SHARD and SHARD_COUNT else {}),
+)
 
 # Main Function
-async def main():
+async def main(force_sync: bool = False):
+    client.force_sync = force_sync
     async with client:
         try:
             await client.load_cogs()  # Load cogs before starting the bot
@@ -78,4 +136,7 @@ async def main():
 
 # Run the Bot
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the Kami Discord bot")
+    parser.add_argument("--force-sync", action="store_true", help="Sync slash commands even if they did not change")
+    args = parser.parse_args()
+    asyncio.run(main(force_sync=args.force_sync))
\ No newline at end of file
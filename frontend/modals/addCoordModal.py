@@ -3,7 +3,6 @@ from dotenv import load_dotenv
 
 import discord
 from discord.ui import Modal, TextInput
-import httpx
 from datetime import datetime, timezone
 
 from views.confirmOverrideView import ConfirmOverwriteView
@@ -87,31 +86,27 @@ class AddCoordModal(Modal):
             "created_at": datetime.now(timezone.utc).isoformat()  #ISO format timestamp
         }
 
-        # Check if coordinate name exists
         try:
             await interaction.response.defer()
-            api_url = f"{self.API_URL}/coordinates/{interaction.guild.id}/{name}"
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(api_url)
-            
-            #response DData for list of coorinates
-            coordinate_list= response.json()
-                
-            if response.status_code == 200:  # Coordinate with the same name exists
-                overwrite_view = ConfirmOverwriteView(data, coordinate_list)
+            client = interaction.client.api_client
+
+            # Conditional create: inserts only if the name is free, otherwise the 409
+            # carries the existing coordinates (one round trip instead of a GET then a POST)
+            response = await client.post(
+                f"{self.API_URL}/coordinates/{interaction.guild.id}/{name}", json=data, params={"if_absent": "true"}
+            )
+
+            if response.status_code == 409:  # Coordinate with the same name exists
+                overwrite_view = ConfirmOverwriteView(data, response.json()["matches"])
                 await interaction.followup.send(
                     "A coordinate with this name already exists. Would you like to overwrite it, add anyway, or cancel the operation?",
                     view=overwrite_view
                 )
                 return
 
-            # Send POST request to FastAPI endpoint (only if name is not taken)
-            async with httpx.AsyncClient() as client:
-                response = await client.post(f"{self.API_URL}/coordinates/{interaction.guild.id}/{name}", json=data)
-
             # Handle response
             if response.status_code == 200:
+                interaction.client.coordinate_cache.record_added(interaction.guild.id, response.json())
                 response_embed = discord.Embed(
                     title="✅ Coordinate Added",
                     description=f"Coordinate `{name}` added successfully!",
@@ -1,10 +1,21 @@
 import discord
 from discord.ui import Modal, TextInput, View, Button
 import httpx
-import asyncio
-from backend.models.chatbotModels import ChatRequest, ChatResponse
+import json
+from backend.models.chatbotModels import ChatRequest
+from utils.apiClient import CHATBOT_TIMEOUT
+from utils.editCoalescer import EditCoalescer
 import os
 
+# Discord caps embed descriptions at 4096 characters
+EMBED_DESCRIPTION_LIMIT = 4096
+
+# Progress line shown while the agent runs a tool
+TOOL_STATUS = {
+    "YouTubeSearch": "📺 Searching YouTube...",
+    "tavily_search_results_json": "🌐 Searching the web...",
+}
+
 
 class AskKamiModal(Modal):
     
@@ -38,130 +49,124 @@ class AskKamiModal(Modal):
         
         await interaction.response.send_message(embed=loading_embed)
         
-        # Start loading animation
-        loading_states = [
-            ("🔍 Searching for information...", "Kami is working on your question. This may take a moment."),
-            ("🤖 Kami is thinking...", "Analyzing your Minecraft question..."),
-            ("📚 Gathering resources...", "Looking up the best tutorials and guides..."),
-            ("⚡ Processing your question...", "Compiling the most helpful information..."),
-            ("🔨 Crafting the perfect answer...", "Almost ready with your response...")
-        ]
-        
         # Get the original response message
         original_message = await interaction.original_response()
-        
-        # Start loading animation task
-        loading_task = asyncio.create_task(self._animate_loading(original_message, loading_states))
+
+        # Streamed tokens and tool progress are merged into paced edits of this message
+        editor = EditCoalescer(original_message)
         API_URL = os.getenv("API_URL", "http://localhost:8000")  # Default to local API if not set
         
         try:
-            # Call the API to get response from Kami
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                api_url = f"{API_URL}/chatbot/{interaction.guild_id}/{interaction.channel_id}" 
-                # Prepare request data
-                #build session_id from guild and channel IDs
-                session_id = f"{interaction.guild_id}-{interaction.channel_id}-{interaction.user.id}"
-                
-                request_data:ChatRequest = {
-                    "query": question,
-                    "session_id": session_id
-                }
-                
-                response:ChatResponse = await client.post(api_url, json=request_data)
-                
-            # Cancel loading animation
-            loading_task.cancel()
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(f"Response data: {data}")  # Debugging line
-                answer = data.get("answer", "I couldn't find an answer to your question.")
-                urls = data.get("urls", [])
-                # Create response embed
-                embed = discord.Embed(
-                    title="🤖 Kami's Response",
-                    description=answer,
-                    color=0x00ff00
-                )
-                
-                # Add user info
-                embed.set_author(
-                    name=f"Asked by {interaction.user.display_name}",
-                    icon_url=interaction.user.avatar.url if interaction.user.avatar else None
-                )
+            # Call the API to stream the response from Kami
+            client = interaction.client.api_client
+            api_url = f"{API_URL}/chatbot/{interaction.guild_id}/{interaction.channel_id}/stream" 
+            # Prepare request data
+            #build session_id from guild and channel IDs
+            session_id = f"{interaction.guild_id}-{interaction.channel_id}-{interaction.user.id}"
                 
-                # Add question as field
-                embed.add_field(
-                    name="📝 Your Question",
-                    value=question,
-                    inline=False
-                )
-                
-                # Add URLs if available
-                if urls:
-                    url_text = "\n".join([f"• [Resource {i+1}]({url})" for i, url in enumerate(urls[:5])])
-                    embed.add_field(
-                        name="🔗 Helpful Resources",
-                        value=url_text,
-                        inline=False
+            request_data:ChatRequest = {
+                "query": question,
+                "session_id": session_id
+            }
+
+            answer = ""
+            status = "🤖 Kami is thinking..."
+            async with client.stream("POST", api_url, json=request_data, timeout=CHATBOT_TIMEOUT) as response:
+                if response.status_code != 200:
+                    error_embed = discord.Embed(
+                        title="❌ Error",
+                        description=f"API returned status code: {response.status_code}",
+                        color=0xff0000
                     )
-                
-                embed.set_footer(text="Powered by Kami AI • Minecraft Expert Assistant")
-                
-                # Create view with additional options
-                view = KamiResponseView(question, interaction.user.id, interaction.guild_id, interaction.channel_id)
-                
-                await original_message.edit(embed=embed, view=view)
-                
-            else:
-                error_embed = discord.Embed(
-                    title="❌ Error",
-                    description=f"API returned status code: {response.status_code}",
-                    color=0xff0000
-                )
-                error_embed.set_footer(text="Please try again later.")
-                await original_message.edit(embed=error_embed)
+                    error_embed.set_footer(text="Please try again later.")
+                    await editor.finish(embed=error_embed)
+                    return
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+
+                    if event["type"] == "token":
+                        answer += event["text"]
+                        editor.update(embed=self._progress_embed(status, answer))
+
+                    elif event["type"] == "tool":
+                        status = TOOL_STATUS.get(event["tool"], f"🔧 Using {event['tool']}...")
+                        editor.update(embed=self._progress_embed(status, answer))
+
+                    elif event["type"] == "done":
+                        embed = self._answer_embed(interaction, question, event.get("answer"), event.get("urls") or [])
+                        # Create view with additional options
+                        view = KamiResponseView(question, interaction.user.id, interaction.guild_id, interaction.channel_id)
+                        await editor.finish(embed=embed, view=view)
+                        return
+
+                    elif event["type"] == "error":
+                        raise Exception(event.get("detail", "Unknown error"))
+
+            raise Exception("The answer stream ended unexpectedly")
                 
         except httpx.TimeoutException:
-            # Cancel loading animation
-            loading_task.cancel()
-            
             timeout_embed = discord.Embed(
                 title="⏰ Request Timeout",
                 description="The request took too long to process. Please try again.",
                 color=0xff9900
             )
-            await original_message.edit(embed=timeout_embed)
+            await editor.finish(embed=timeout_embed)
             
         except Exception as e:
-            # Cancel loading animation
-            loading_task.cancel()
-            
             error_embed = discord.Embed(
                 title="❌ Error",
                 description=f"An error occurred: {str(e)}",
                 color=0xff0000
             )
             error_embed.set_footer(text="Please try again later.")
-            await original_message.edit(embed=error_embed)
+            await editor.finish(embed=error_embed)
 
-    async def _animate_loading(self, message, states):
-        """Animate the loading message"""
-        try:
-            index = 0
-            while True:
-                title, description = states[index]
-                embed = discord.Embed(
-                    title=title,
-                    description=description,
-                    color=0x00ff00
-                )
-                embed.set_footer(text="Powered by Kami AI • Minecraft Expert Assistant")
-                await message.edit(embed=embed)
-                index = (index + 1) % len(states)
-                await asyncio.sleep(2)  # Change state every 2 seconds
-        except asyncio.CancelledError:
-            pass  # Task was cancelled, which is expected
+    def _progress_embed(self, status, answer):
+        """Embed shown while the answer streams in"""
+        embed = discord.Embed(
+            title=status if not answer else "✍️ Kami is answering...",
+            description=answer[-EMBED_DESCRIPTION_LIMIT:] if answer else "Kami is working on your question. This may take a moment.",
+            color=0x00ff00
+        )
+        embed.set_footer(text="Powered by Kami AI • Minecraft Expert Assistant")
+        return embed
+
+    def _answer_embed(self, interaction, question, answer, urls):
+        """Final embed with the complete answer"""
+        # Create response embed
+        embed = discord.Embed(
+            title="🤖 Kami's Response",
+            description=(answer or "I couldn't find an answer to your question.")[:EMBED_DESCRIPTION_LIMIT],
+            color=0x00ff00
+        )
+        
+        # Add user info
+        embed.set_author(
+            name=f"Asked by {interaction.user.display_name}",
+            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+        )
+        
+        # Add question as field
+        embed.add_field(
+            name="📝 Your Question",
+            value=question[:1024],
+            inline=False
+        )
+        
+        # Add URLs if available
+        if urls:
+            url_text = "\n".join([f"• [Resource {i+1}]({url})" for i, url in enumerate(urls[:5])])
+            embed.add_field(
+                name="🔗 Helpful Resources",
+                value=url_text,
+                inline=False
+            )
+        
+        embed.set_footer(text="Powered by Kami AI • Minecraft Expert Assistant")
+        return embed
 
 class KamiResponseView(View):
     def __init__(self, original_question, user_id, guild_id, channel_id):
@@ -3,10 +3,9 @@ from dotenv import load_dotenv
 
 import discord
 from discord.ui import Modal, TextInput
-import httpx
 
 class FindCoordModal(Modal):
-    def __init__(self):
+    def __init__(self, name: str = None):
         super().__init__(title="Find Coordinate")
         
         load_dotenv()
@@ -16,7 +15,8 @@ class FindCoordModal(Modal):
             label="Coordinate Name", 
             placeholder="Enter the name of the coordinate to find", 
             style=discord.TextStyle.short, 
-            required=True
+            required=True,
+            default=name  # Prefilled from the slash command's autocompleted argument
         )
         
         self.add_item(self.name)
@@ -26,36 +26,47 @@ class FindCoordModal(Modal):
         guild_id = interaction.guild.id  # Get the guild ID to identify server-specific coordinates
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.API_URL}/coordinates/{guild_id}/{name}")
-                coordinates = response.json()
+            client = interaction.client.api_client
+            coordinates = await interaction.client.coordinate_cache.coordinates_named(client, self.API_URL, guild_id, name)
 
-                if not coordinates:
-                    response_embed = discord.Embed(
-                        title="❌ Coordinate Not Found",
-                        description=f"Could not find a coordinate named `{name}`.",
-                        color=discord.Color.red()
+            if not coordinates:
+                description = f"Could not find a coordinate named `{name}`."
+
+                # Suggest close names from the search index instead of a bare miss
+                search = await client.get(
+                    f"{self.API_URL}/coordinates/search/{guild_id}", params={"q": name, "limit": 5}
+                )
+                suggestions = search.json() if search.status_code == 200 else []
+                if suggestions:
+                    description += "\n\n**Did you mean:**\n" + "\n".join(
+                        f"- `{hit['coordinateName']}`" for hit in suggestions
                     )
-                    await interaction.response.send_message(embed=response_embed, ephemeral=False)
-                    return
 
-                # Pagination (For now, just Page 1/1 since pagination isn't implemented)
-                total_pages = 1  # This would be dynamic if pagination is added
                 response_embed = discord.Embed(
-                    title=f"📌 Saved Coordinates (Page 1/{total_pages})",
-                    color=discord.Color.green()
+                    title="❌ Coordinate Not Found",
+                    description=description,
+                    color=discord.Color.red()
                 )
+                await interaction.response.send_message(embed=response_embed, ephemeral=False)
+                return
 
-                for coordinate in coordinates:
-                    response_embed.add_field(
-                        name=f"📌 {coordinate['coordinateName']}",
-                        value=f"**Coordinates:** `{coordinate['coordinates']['x']}, {coordinate['coordinates']['y']}, {coordinate['coordinates']['z']}`\n"
-                              f"**Dimension:** `{coordinate['dimension']}`\n"
-                              f"**Saved by:** `{coordinate['username']}`",
-                        inline=False
-                    )
+            # Pagination (For now, just Page 1/1 since pagination isn't implemented)
+            total_pages = 1  # This would be dynamic if pagination is added
+            response_embed = discord.Embed(
+                title=f"📌 Saved Coordinates (Page 1/{total_pages})",
+                color=discord.Color.green()
+            )
 
-                await interaction.response.send_message(embed=response_embed, ephemeral=False)
+            for coordinate in coordinates:
+                response_embed.add_field(
+                    name=f"📌 {coordinate['coordinateName']}",
+                    value=f"**Coordinates:** `{coordinate['coordinates']['x']}, {coordinate['coordinates']['y']}, {coordinate['coordinates']['z']}`\n"
+                          f"**Dimension:** `{coordinate['dimension']}`\n"
+                          f"**Saved by:** `{coordinate['username']}`",
+                    inline=False
+                )
+
+            await interaction.response.send_message(embed=response_embed, ephemeral=False)
 
         except Exception as e:
             error_embed = discord.Embed(
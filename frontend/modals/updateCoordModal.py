@@ -4,12 +4,11 @@ from dotenv import load_dotenv
 
 import discord
 from discord.ui import Modal, TextInput, View, Button
-import httpx
 from views.coordinateSelectView import CoordinateSelectView
 from modals.updateModal import UpdateModal
 
 class UpdateCoordModal(Modal):
-    def __init__(self):
+    def __init__(self, name: str = None):
         super().__init__(title="Update Coordinate")
         
         load_dotenv()
@@ -19,7 +18,8 @@ class UpdateCoordModal(Modal):
             label="Coordinate Name", 
             placeholder="Enter the name of the coordinate to update", 
             style=discord.TextStyle.short, 
-            required=True
+            required=True,
+            default=name  # Prefilled from the slash command's autocompleted argument
         )
         self.add_item(self.name)
         
@@ -28,36 +28,35 @@ class UpdateCoordModal(Modal):
         guild_id = interaction.guild.id
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.API_URL}/coordinates/{guild_id}/{name}")
-                coordinates = response.json()
+            client = interaction.client.api_client
+            coordinates = await interaction.client.coordinate_cache.coordinates_named(client, self.API_URL, guild_id, name)
 
-                # Handle not found
-                if isinstance(coordinates, dict) and coordinates.get("detail") == '404: Coordinate Name not found':
-                    embed = discord.Embed(
-                        title="❌ Coordinate Not Found",
-                        description=f"Could not find a coordinate named `{name}`.",
-                        color=discord.Color.red()
-                    )
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-                    return
+            # Handle not found
+            if not coordinates:
+                embed = discord.Embed(
+                    title="❌ Coordinate Not Found",
+                    description=f"Could not find a coordinate named `{name}`.",
+                    color=discord.Color.red()
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
 
-                # Validate list structure
-                if not isinstance(coordinates, list) or not all(isinstance(c, dict) for c in coordinates):
-                    await interaction.response.send_message("⚠️ Error: Invalid coordinate format from API.", ephemeral=True)
-                    return
+            # Validate list structure
+            if not isinstance(coordinates, list) or not all(isinstance(c, dict) for c in coordinates):
+                await interaction.response.send_message("⚠️ Error: Invalid coordinate format from API.", ephemeral=True)
+                return
                 
-                # More than one coordinate found — show select dropdown
-                select_view = CoordinateSelectView(
-                    coordinates=coordinates,
-                    callback_function=self.handle_coordinate_selection
-                )
+            # More than one coordinate found — show select dropdown
+            select_view = CoordinateSelectView(
+                coordinates=coordinates,
+                callback_function=self.handle_coordinate_selection
+            )
 
-                message = await interaction.response.send_message(
-                    "Please select a coordinate to update:",
-                    view=select_view
-                )
-                select_view.message = message
+            message = await interaction.response.send_message(
+                "Please select a coordinate to update:",
+                view=select_view
+            )
+            select_view.message = message
 
         except Exception as e:
             embed = discord.Embed(
@@ -100,28 +100,29 @@ class UpdateModal(Modal):
         
         try:
             # Since the FastAPI route expects guild_id as a query parameter
-            async with httpx.AsyncClient() as client:
-                response = await client.put(
-                    f"{self.API_URL}/coordinates/{coordinate_id}",
-                    params={"guild_id": guild_id},  # Pass guild_id as a query parameter
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                )
+            client = interaction.client.api_client
+            response = await client.put(
+                f"{self.API_URL}/coordinates/{coordinate_id}",
+                params={"guild_id": guild_id},  # Pass guild_id as a query parameter
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            )
                 
-                if response.status_code == 200:
-                    success_embed = discord.Embed(
-                        title="✅ Coordinate Updated",
-                        description=f"Coordinate `{name}` has been updated successfully.",
-                        color=discord.Color.green()
-                    )
-                    await interaction.followup.send(embed=success_embed)
-                else:
-                    error_embed = discord.Embed(
-                        title="❌ Error Updating Coordinate",
-                        description=f"Failed to update coordinate `{name}`. Status code: {response.status_code}. Response: {response.text}",
-                        color=discord.Color.red()
-                    )
-                    await interaction.followup.send(embed=error_embed, ephemeral=True)
+            if response.status_code == 200:
+                interaction.client.coordinate_cache.invalidate(guild_id)
+                success_embed = discord.Embed(
+                    title="✅ Coordinate Updated",
+                    description=f"Coordinate `{name}` has been updated successfully.",
+                    color=discord.Color.green()
+                )
+                await interaction.followup.send(embed=success_embed)
+            else:
+                error_embed = discord.Embed(
+                    title="❌ Error Updating Coordinate",
+                    description=f"Failed to update coordinate `{name}`. Status code: {response.status_code}. Response: {response.text}",
+                    color=discord.Color.red()
+                )
+                await interaction.followup.send(embed=error_embed, ephemeral=True)
         except httpx.RequestError as e:
             error_embed = discord.Embed(
                 title="❌ Request Error",
@@ -0,0 +1,35 @@
+import os
+import httpx
+from dotenv import load_dotenv
+
+# Per-route timeouts (seconds)
+COORDINATE_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+CHATBOT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Keep-alive pool shared by every command, modal and view
+API_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0)
+
+
+def create_api_client() -> httpx.AsyncClient:
+    """
+    Build the bot's long-lived client for the Kami API.
+
+    Connections are pooled and kept alive across interactions, so commands no
+    longer pay TCP/TLS setup on every request. Set API_HTTP2=true to negotiate
+    HTTP/2 (needs the `h2` package, i.e. httpx[http2]).
+    """
+    load_dotenv()
+    http2 = os.getenv("API_HTTP2", "false").lower() == "true"
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            print("API_HTTP2 is set but the h2 package is not installed, falling back to HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        base_url=os.getenv("API_URL", ""),
+        http2=http2,
+        timeout=COORDINATE_TIMEOUT,
+        limits=API_LIMITS,
+    )
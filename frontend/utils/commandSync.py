@@ -0,0 +1,52 @@
+import hashlib
+import json
+import os
+
+# Where the hash of the last synced command tree is kept (next to kami.py by default)
+SYNC_STATE_PATH = os.getenv(
+    "COMMAND_SYNC_STATE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".command_tree.json"),
+)
+
+
+def command_tree_hash(tree) -> str:
+    """Stable hash of the global application commands as they would be sent to Discord"""
+    payload = sorted((command.to_dict(tree) for command in tree.get_commands()), key=lambda c: (c["type"], c["name"]))
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def _read_state(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state(path: str, state: dict):
+    # Write then rename so an interrupted write never leaves a half-written file behind
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(state, file)
+    os.replace(temp_path, path)
+
+
+async def sync_if_changed(tree, application_id: int, force: bool = False, path: str = SYNC_STATE_PATH) -> bool:
+    """
+    Sync the command tree with Discord only when it differs from the last sync.
+
+    The hash is stored per application, so switching bot tokens still syncs.
+    Returns True when a sync request was made.
+    """
+    tree_hash = command_tree_hash(tree)
+    state = _read_state(path)
+    if not force and state.get(str(application_id)) == tree_hash:
+        return False
+
+    await tree.sync()
+    state[str(application_id)] = tree_hash
+    try:
+        _write_state(path, state)
+    except OSError as e:
+        print(f"Could not save the command tree hash to {path}: {e}")
+    return True
@@ -0,0 +1,131 @@
+import os
+import time
+from collections import OrderedDict
+from typing import List, Tuple
+
+from utils.nameAutocomplete import CoordinateNameIndex
+
+# Fields every cached coordinate carries: what the list/find embeds show plus what
+# the select/overwrite views need (guild_id, _id is always returned)
+CACHED_FIELDS = "coordinateName,coordinates,dimension,username,guild_id"
+# Coordinates per /listcoords page
+LIST_PAGE_SIZE = 5
+
+
+class CoordinateCache:
+    """
+    Per-guild cache of the coordinates the bot fetched from the API.
+
+    Entries expire after `ttl` seconds and the whole cache holds at most
+    `max_coordinates` coordinates (least recently used guilds are evicted first).
+    Writes made through the bot update or invalidate the affected guild, so an
+    active server's /listcoords and /findcoord are served without a round trip.
+    """
+
+    def __init__(self, ttl: float = None, max_coordinates: int = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("COORDINATE_CACHE_TTL", "120"))
+        self.max_coordinates = max_coordinates or int(os.getenv("COORDINATE_CACHE_MAX", "50000"))
+        # key: (guild_id, name) for a name lookup, (guild_id, ("page", after, before)) for one /listcoords page
+        self._entries: "OrderedDict[tuple, Tuple[float, object, int]]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        # Prefix index of names for slash-command autocomplete, kept in step with the writes below
+        self.names = CoordinateNameIndex()
+
+    # Raw cache operations
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key, value, size: int = None):
+        self._discard(key)
+        size = (len(value) if size is None else size) or 1
+        self._entries[key] = (time.monotonic() + self.ttl, value, size)
+        self._size += size
+        while self._size > self.max_coordinates and len(self._entries) > 1:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[2]
+
+    def _discard_pages(self, guild_id: str):
+        for key in [key for key in self._entries if key[0] == guild_id and isinstance(key[1], tuple)]:
+            self._discard(key)
+
+    # Reads (fall back to the API on a miss)
+    async def guild_page(self, client, api_url: str, guild_id, after: str = None, before: str = None) -> dict:
+        """
+        One /listcoords page of the guild, in dimension order, as
+        {"coordinates": [...], "next": cursor or None, "prev": cursor or None}.
+        """
+        key = (str(guild_id), ("page", after, before))
+        page = self._get(key)
+        if page is not None:
+            self.hits += 1
+            return page
+
+        self.misses += 1
+        params = {"limit": LIST_PAGE_SIZE, "sort": "dimension", "fields": CACHED_FIELDS}
+        if after is not None:
+            params["after"] = after
+        if before is not None:
+            params["before"] = before
+        response = await client.get(f"{api_url}/coordinates/{guild_id}", params=params)
+        response.raise_for_status()
+        page = {
+            "coordinates": response.json(),
+            "next": response.headers.get("X-Next-Cursor"),
+            "prev": response.headers.get("X-Prev-Cursor"),
+        }
+        self._put(key, page, len(page["coordinates"]))
+        return page
+
+    async def coordinates_named(self, client, api_url: str, guild_id, name: str) -> List[dict]:
+        """Coordinates of the guild saved under exactly this name (empty list if none)"""
+        key = (str(guild_id), name)
+        coordinates = self._get(key)
+        if coordinates is not None:
+            self.hits += 1
+            return coordinates
+
+        self.misses += 1
+        response = await client.get(f"{api_url}/coordinates/{guild_id}/{name}", params={"fields": CACHED_FIELDS})
+        if response.status_code == 200:
+            coordinates = response.json()
+        elif response.status_code == 404:
+            coordinates = []
+        else:
+            response.raise_for_status()
+        self._put(key, coordinates)
+        return coordinates
+
+    # Write-through from the bot's own writes
+    def record_added(self, guild_id, coordinate: dict):
+        """A coordinate was created: drop the stale name lookup and pages, add it to the autocomplete names"""
+        guild_id = str(guild_id)
+        self._discard((guild_id, coordinate.get("coordinateName")))
+        # Pages shift around the new coordinate, refetch them
+        self._discard_pages(guild_id)
+        self.names.add(guild_id, coordinate.get("coordinateName", ""))
+
+    def record_cleared(self, guild_id):
+        """Every coordinate of the guild was deleted"""
+        self.invalidate(guild_id)
+        self.names.clear(guild_id)
+
+    def invalidate(self, guild_id):
+        """Forget everything cached for the guild (after updates and deletes)"""
+        guild_id = str(guild_id)
+        for key in [key for key in self._entries if key[0] == guild_id]:
+            self._discard(key)
+        self.names.mark_stale(guild_id)
@@ -0,0 +1,57 @@
+import asyncio
+import os
+from typing import Optional
+
+import discord
+
+# Minimum seconds between two edits of the same message. Discord allows about 5
+# message edits per 5 seconds per channel, so one edit per 1.2s leaves headroom
+# for the final edit and anything else the bot does in that channel.
+EDIT_INTERVAL = float(os.getenv("STREAM_EDIT_INTERVAL", "1.2"))
+
+
+class EditCoalescer:
+    """
+    Merge a stream of updates to one message into rate-limit friendly edits.
+
+    `update()` only records the latest wanted state; a background task applies it
+    at most once every `interval` seconds, so any number of updates in between
+    cost a single edit. `finish()` applies the final state and stops the task.
+    """
+
+    def __init__(self, message: discord.Message, interval: float = EDIT_INTERVAL):
+        self.message = message
+        self.interval = interval
+        self._pending: Optional[dict] = None
+        self._closed = False
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def update(self, **edit_kwargs):
+        """Replace the pending edit (e.g. embed=...) with the latest state"""
+        self._pending = edit_kwargs
+        self._wake.set()
+
+    async def finish(self, **edit_kwargs):
+        """Apply the final state (as soon as the rate allows) and wait for it"""
+        if edit_kwargs:
+            self._pending = edit_kwargs
+        self._closed = True
+        self._wake.set()
+        await self._task
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+
+            edit_kwargs, self._pending = self._pending, None
+            if edit_kwargs is not None:
+                try:
+                    await self.message.edit(**edit_kwargs)
+                except discord.HTTPException as e:
+                    print(f"Failed to edit streamed message: {e}")
+
+            if self._closed and self._pending is None:
+                return
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import os
+import time
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict
+from typing import Dict, List
+
+# Discord shows at most 25 autocomplete choices
+MAX_CHOICES = 25
+# How long the first autocomplete of a cold guild may wait for its names (Discord allows 3s)
+COLD_LOAD_BUDGET = 1.5
+
+logger = logging.getLogger(__name__)
+
+
+class GuildNames:
+    """Sorted, case-insensitive array of one guild's coordinate names"""
+
+    def __init__(self, names: List[str] = ()):
+        self.counts = Counter()
+        self.display: Dict[str, str] = {}
+        for name in names:
+            self.counts[name.lower()] += 1
+            self.display.setdefault(name.lower(), name)
+        self.keys = sorted(self.counts)
+        self.loaded_at = time.monotonic()
+        self.stale = False
+
+    def add(self, name: str):
+        key = name.lower()
+        if not self.counts[key]:
+            insort(self.keys, key)
+            self.display[key] = name
+        self.counts[key] += 1
+
+    def prefix(self, current: str, limit: int = MAX_CHOICES) -> List[str]:
+        """Names starting with `current` (case-insensitive), in alphabetical order"""
+        current = current.lower()
+        start = bisect_left(self.keys, current)
+        matches = []
+        for key in self.keys[start:start + limit]:
+            if not key.startswith(current):
+                break
+            matches.append(self.display[key])
+        return matches
+
+
+class CoordinateNameIndex:
+    """
+    Per-guild prefix index of coordinate names serving slash-command autocomplete.
+
+    Lookups are a bisect into a sorted array, so suggestions are answered locally in
+    microseconds. Guilds are loaded from the API (names only) on first use, refreshed
+    in the background once older than `ttl` or after the bot's own writes mark them
+    stale, and the least recently used guilds beyond `max_guilds` are dropped.
+    """
+
+    def __init__(self, ttl: float = None, max_guilds: int = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("NAME_INDEX_TTL", "300"))
+        self.max_guilds = max_guilds or int(os.getenv("NAME_INDEX_MAX_GUILDS", "1000"))
+        self._guilds: "OrderedDict[str, GuildNames]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Task] = {}
+
+    async def _load(self, client, api_url: str, guild_id: str):
+        response = await client.get(f"{api_url}/coordinates/{guild_id}", params={"fields": "coordinateName"})
+        response.raise_for_status()
+        self._guilds[guild_id] = GuildNames([coord["coordinateName"] for coord in response.json()])
+        self._guilds.move_to_end(guild_id)
+        while len(self._guilds) > self.max_guilds:
+            self._guilds.popitem(last=False)
+
+    def refresh(self, client, api_url: str, guild_id) -> asyncio.Task:
+        """Start (or join) a background load of the guild's names"""
+        guild_id = str(guild_id)
+        task = self._loading.get(guild_id)
+        if task is None:
+            task = asyncio.create_task(self._load(client, api_url, guild_id))
+            task.add_done_callback(lambda task: self._loaded(guild_id, task))
+            self._loading[guild_id] = task
+        return task
+
+    def _loaded(self, guild_id: str, task: asyncio.Task):
+        self._loading.pop(guild_id, None)
+        # Background refreshes are not awaited by anyone, so their errors are reported here
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Failed to load coordinate names of guild {guild_id}: {task.exception()}")
+
+    async def suggest(self, client, api_url: str, guild_id, current: str, limit: int = MAX_CHOICES) -> List[str]:
+        """Coordinate names of the guild starting with `current`"""
+        guild_id = str(guild_id)
+        names = self._guilds.get(guild_id)
+        if names is None:
+            # Cold guild: give the load a bounded head start, the next keystroke will have it
+            try:
+                await asyncio.wait_for(asyncio.shield(self.refresh(client, api_url, guild_id)), COLD_LOAD_BUDGET)
+            except Exception:
+                return []
+            names = self._guilds.get(guild_id)
+            if names is None:
+                return []
+        elif names.stale or time.monotonic() - names.loaded_at > self.ttl:
+            # Serve the current names while they reload
+            self.refresh(client, api_url, guild_id)
+        self._guilds.move_to_end(guild_id)
+        return names.prefix(current, limit)
+
+    # Write-through from the bot's own writes
+    def add(self, guild_id, name: str):
+        names = self._guilds.get(str(guild_id))
+        if names is not None:
+            names.add(name)
+
+    def clear(self, guild_id):
+        self._guilds[str(guild_id)] = GuildNames()
+
+    def mark_stale(self, guild_id):
+        """Names may have been removed or renamed: reload on the next lookup"""
+        names = self._guilds.get(str(guild_id))
+        if names is not None:
+            names.stale = True
@@ -24,10 +24,11 @@ class ConfirmOverwriteView(discord.ui.View):
 
         try:
             # Send the POST request to add the coordinate
-            async with httpx.AsyncClient() as client:
-                response = await client.post(api_url, json=self.data)
+            client = interaction.client.api_client
+            response = await client.post(api_url, json=self.data)
 
             if response.status_code == 200:
+                interaction.client.coordinate_cache.record_added(self.data['guild_id'], response.json())
                 # Successfully added, so confirm with an embed
                 response_embed = discord.Embed(
                     title="✅ Coordinate Added",
@@ -144,10 +145,11 @@ class ConfirmOverwriteView(discord.ui.View):
             # Add your overwrite logic here
             api_url = f"{self.API_URL}/coordinates/{selected_coordinate['_id']}"
             #Call fastAPI endpoint to overwrite Coordinate
-            async with httpx.AsyncClient() as client:
-                response = await client.put(api_url, json=payload, params={"guild_id": selected_coordinate['guild_id']})
+            client = interaction.client.api_client
+            response = await client.put(api_url, json=payload, params={"guild_id": selected_coordinate['guild_id']})
             
             if response.status_code == 200:
+                interaction.client.coordinate_cache.invalidate(selected_coordinate['guild_id'])
                 # Successfully added, so confirm with an embed
                 response_embed = discord.Embed(
                     title="✅ Coordinate Overwritten",
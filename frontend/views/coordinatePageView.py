@@ -0,0 +1,133 @@
+import os
+from typing import Optional, Tuple
+from dotenv import load_dotenv
+
+import discord
+from discord.ui import View, Button, DynamicItem
+
+load_dotenv()
+API_URL = os.getenv('API_URL')
+
+CUSTOM_ID_PREFIX = "kami:coords"
+# Discord rejects longer custom_ids (only reachable with absurdly long dimension names)
+MAX_CUSTOM_ID_LENGTH = 100
+
+
+class CoordinatePageButton(DynamicItem[Button], template=r"kami:coords:(?P<direction>prev|next):(?P<page>\d+):(?P<cursor>[\w-]+)"):
+    """
+    Previous/next button of a /listcoords message.
+
+    Everything needed to fetch the target page (direction, page number and the API
+    cursor) lives in the custom_id, so the buttons keep working for as long as the
+    message exists, across bot restarts, without the bot holding any listing state.
+    """
+
+    def __init__(self, direction: str, page: int, cursor: str):
+        self.direction = direction
+        self.page = page
+        self.cursor = cursor
+        super().__init__(
+            Button(
+                emoji="⬅️" if direction == "prev" else "➡️",
+                style=discord.ButtonStyle.secondary,
+                custom_id=f"{CUSTOM_ID_PREFIX}:{direction}:{page}:{cursor}",
+            )
+        )
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: Button, match):
+        return cls(match["direction"], int(match["page"]), match["cursor"])
+
+    async def callback(self, interaction: discord.Interaction):
+        cursors = {"after": self.cursor} if self.direction == "next" else {"before": self.cursor}
+        try:
+            embed, view = await coordinate_page(interaction.client, interaction.guild_id, self.page, **cursors)
+            if embed is None:
+                # The list changed under the message (e.g. coordinates deleted), start over
+                embed, view = await coordinate_page(interaction.client, interaction.guild_id)
+            if embed is None:
+                embed = discord.Embed(
+                    title="❌ No Coordinates Saved",
+                    description="There are no saved coordinates for this server.",
+                    color=discord.Color.red()
+                )
+            await interaction.response.edit_message(embed=embed, view=view)
+
+        except Exception as e:
+            await interaction.response.send_message(f"An error occurred: {str(e)}", ephemeral=True)
+
+
+class DisabledPageButton(DynamicItem[Button], template=r"kami:coords:(?P<direction>prev|next):disabled"):
+    """
+    Greyed out previous/next button on the first/last page.
+
+    Dynamic like the live buttons, so a listing's view holds no persistent item and
+    discord.py does not keep it in memory for the lifetime of the message.
+    """
+
+    def __init__(self, direction: str):
+        self.direction = direction
+        super().__init__(
+            Button(
+                emoji="⬅️" if direction == "prev" else "➡️",
+                style=discord.ButtonStyle.secondary,
+                custom_id=f"{CUSTOM_ID_PREFIX}:{direction}:disabled",
+                disabled=True,
+            )
+        )
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: Button, match):
+        return cls(match["direction"])
+
+    async def callback(self, interaction: discord.Interaction):
+        # Disabled buttons cannot be clicked; acknowledge anything that slips through
+        await interaction.response.defer()
+
+
+def page_button(direction: str, page: int, cursor: Optional[str]) -> DynamicItem:
+    """The navigation button for a direction, disabled when there is nothing that way"""
+    if cursor is not None:
+        button = CoordinatePageButton(direction, page, cursor)
+        if len(button.item.custom_id) <= MAX_CUSTOM_ID_LENGTH:
+            return button
+    return DisabledPageButton(direction)
+
+
+async def coordinate_page(bot, guild_id, page: int = 1, after: str = None, before: str = None) -> Tuple[Optional[discord.Embed], Optional[View]]:
+    """
+    Render one /listcoords page fetched from the API (sorted by dimension).
+
+    Returns (None, None) when the page is empty.
+    """
+    result = await bot.coordinate_cache.guild_page(bot.api_client, API_URL, guild_id, after=after, before=before)
+    coordinates = result["coordinates"]
+    if not coordinates:
+        return None, None
+
+    embed = discord.Embed(
+        title=f"Saved Coordinates (Page {page})",
+        color=discord.Color.green()
+    )
+    for coord in coordinates:
+        name = coord.get("coordinateName", "Unknown Name")
+        coords = coord.get("coordinates", "Unknown Coordinates")
+        dimension = coord.get("dimension", "Unknown Dimension")
+        username = coord.get("username", "Unknown User")
+
+        #format the coords
+        coords = f"{coords.get('x', 'Unknown')},{coords.get('y', 'Unknown')},{coords.get('z', 'Unknown')}"
+        embed.add_field(
+            name=f"📌**{name}**",
+            value=f"**Coordinates: **{coords}\n**Dimension:** {dimension}\n**Saved by: {username}**",
+            inline=False
+        )
+
+    # A single page needs no navigation
+    if result["prev"] is None and result["next"] is None:
+        return embed, None
+
+    view = View(timeout=None)
+    view.add_item(page_button("prev", max(page - 1, 1), result["prev"]))
+    view.add_item(page_button("next", page + 1, result["next"]))
+    return embed, view